@@ -10,20 +10,94 @@ This script:
 3. Marks the @Component annotation as processed (/*--@Component--*/) and @Service as processed (/*--@Service--*/)
 """
 
+import os
 import re
 import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Match, Optional, Tuple, Set
 
 # Import functions from our other scripts
 try:
-    from find_class_names import find_class_names
-    from find_interface_names import find_interface_names
+    from find_class_names import find_class_names, find_class_names_from_text
+    from find_interface_names import find_interface_names, find_interface_names_from_text
 except ImportError:
     # print("Error: Could not import required modules. Make sure find_class_names.py and find_interface_names.py are in the same directory.")
     sys.exit(1)
 
 
+# Single pattern for @Component and its alias @Service, active or processed:
+# - active:    /* @Component */, /*@Component*/, /* @Service */ or /*@Service*/
+# - processed: /*--@Component--*/ or /*--@Service--*/ (the 'processed' group holds the leading '--')
+# Both kinds start with the literal '/*', so lines without it are rejected at once
+_COMPONENT_RE = re.compile(r'/\*(?P<processed>--)?\s*@(?P<kind>Component|Service)\s*(?(processed)--)\*/')
+# Pattern to match class declarations
+_CLASS_RE = re.compile(r'class\s+([A-Za-z_][A-Za-z0-9_]*)\s*(?:[:{])')
+# Annotations allowed between @Component and the class declaration
+_CONTINUATION_ANNOTATION_RE = re.compile(r'/\*\s*@(Component|Service|Scope|Autowired)\s*\*/')
+# Legacy COMPONENT macro on a line of its own
+_LEGACY_COMPONENT_RE = re.compile(r'^COMPONENT\s*$')
+# Every form find_component_macros() reports needs "@Component", "@Service" or "COMPONENT" on its line
+_COMPONENT_MARKER_LINE_RE = re.compile(r'^[^\n]*?(?:@Component|@Service|COMPONENT)[^\n]*', re.MULTILINE)
+# A line including its newline, as file.readlines() returns it
+_LINE_RE = re.compile(r'[^\n]*\n|[^\n]+')
+# Byte strings of which a file needs at least one to hold any @Component form
+_COMPONENT_MARKERS = (b'@Component', b'@Service', b'COMPONENT')
+# Below this many files, starting worker processes costs more than check_multiple_files() saves
+_PARALLEL_MIN_FILES = 32
+
+
+def _read_component_source(file_path: str) -> Optional[str]:
+    """
+    Read a C++ file, unless its raw bytes show it cannot hold any @Component form.
+    The content is decoded and its newlines translated the way text-mode reading does.
+    
+    Args:
+        file_path: Path to the C++ file
+        
+    Returns:
+        File content, or None if none of the markers occurs in the file
+        
+    Raises:
+        OSError or UnicodeDecodeError if the file cannot be read
+    """
+    with open(file_path, 'rb') as file:
+        data = file.read()
+    # Substring probes run in C; most files hold none of the markers and skip decoding and every regex
+    if not any(marker in data for marker in _COMPONENT_MARKERS):
+        return None
+    content = data.decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _match_component_annotations(stripped_line: str) -> Tuple[bool, Optional[Match], Optional[Match]]:
+    """
+    Match every @Component/@Service form on a line with one pass of the combined pattern.
+    
+    Args:
+        stripped_line: Stripped line of C++ source
+        
+    Returns:
+        Tuple of (whether a processed annotation is present, first active @Component match,
+        first active @Service match)
+    """
+    processed = False
+    component_match = None
+    service_match = None
+    for match in _COMPONENT_RE.finditer(stripped_line):
+        if match.group('processed'):
+            processed = True
+        elif match.group('kind') == 'Component':
+            if component_match is None:
+                component_match = match
+        elif service_match is None:
+            service_match = match
+    return processed, component_match, service_match
+
+
 def find_component_macros(file_path: str) -> List[Dict[str, str]]:
     """
     Find all @Component or @Service annotations in a C++ file and their context.
@@ -35,11 +109,10 @@ def find_component_macros(file_path: str) -> List[Dict[str, str]]:
     Returns:
         List of dictionaries with 'macro', 'line_number', 'context', 'class_name', 'has_class', and 'has_interface' keys
     """
-    component_macros = []
-    
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
+        content = _read_component_source(file_path)
+        if content is None:
+            return []
     except FileNotFoundError:
         # print(f"Error: File '{file_path}' not found")
         return []
@@ -47,37 +120,50 @@ def find_component_macros(file_path: str) -> List[Dict[str, str]]:
         # print(f"Error reading file '{file_path}': {e}")
         return []
     
-    # Pattern to match @Component annotation (search for /* @Component */ or /*@Component*/)
-    # Also check for already processed /*--@Component--*/ pattern
-    component_annotation_pattern = re.compile(r'/\*\s*@Component\s*\*/')
-    component_processed_pattern = re.compile(r'/\*--\s*@Component\s*--\*/')
-    
-    # Pattern to match @Service annotation (alias for @Component)
-    # Also check for already processed /*--@Service--*/ pattern
-    service_annotation_pattern = re.compile(r'/\*\s*@Service\s*\*/')
-    service_processed_pattern = re.compile(r'/\*--\s*@Service\s*--\*/')
+    return find_component_macros_from_text(content)
+
+
+def find_component_macros_from_text(content: str) -> List[Dict[str, str]]:
+    """
+    Find all @Component or @Service annotations in already-read C++ source text.
     
-    # Pattern to match class declarations
-    class_pattern = r'class\s+([A-Za-z_][A-Za-z0-9_]*)\s*(?:[:{])'
+    Args:
+        content: C++ source code, with newlines translated as text-mode reading does
+        
+    Returns:
+        List of dictionaries as described in find_component_macros()
+    """
+    component_macros = []
     
-    for line_num, line in enumerate(lines, 1):
-        stripped_line = line.strip()
+    # Split into lines only once a candidate line is found; the look-ahead needs them
+    lines = None
+    
+    # One scan of the whole content finds the candidate lines; line numbers are kept as a running newline count
+    line_index = 0
+    counted_up_to = 0
+    for marker_match in _COMPONENT_MARKER_LINE_RE.finditer(content):
+        line_index += content.count('\n', counted_up_to, marker_match.start())
+        counted_up_to = marker_match.start()
+        line_num = line_index + 1
+        stripped_line = marker_match.group(0).strip()
+        if lines is None:
+            lines = _LINE_RE.findall(content)
+        
+        processed, component_match, service_match = _match_component_annotations(stripped_line)
         
         # Skip already processed annotations
-        if component_processed_pattern.search(stripped_line) or service_processed_pattern.search(stripped_line):
+        if processed:
             continue
         
         # Skip other comments that aren't @Component or @Service annotations
         # But allow /* @Component */ or /* @Service */ annotations to be processed
-        if stripped_line.startswith('/*') and not component_annotation_pattern.search(stripped_line) and not service_annotation_pattern.search(stripped_line):
+        if stripped_line.startswith('/*') and not component_match and not service_match:
             continue
         # Skip single-line comments
         if stripped_line.startswith('//'):
             continue
             
         # Check if line contains valid @Component or @Service annotation
-        component_match = component_annotation_pattern.search(stripped_line)
-        service_match = service_annotation_pattern.search(stripped_line)
         if component_match or service_match:
             annotation_text = component_match.group(0) if component_match else service_match.group(0)
             
@@ -88,36 +174,34 @@ def find_component_macros(file_path: str) -> List[Dict[str, str]]:
             context_lines = []
             
             # Check next 10 lines for class declaration (allowing for multiple annotations/macros)
-            for i in range(line_num, min(line_num + 11, len(lines) + 1)):
-                if i <= len(lines):
-                    next_line = lines[i - 1].strip()
-                    context_lines.append(next_line)
-                    
-                    # Skip other comments that aren't annotations
-                    # But allow /* @Component */, /* @Service */, /* @Scope */, /* @Autowired */ annotations to be processed
-                    if next_line.startswith('/*') and not re.search(r'/\*\s*@(Component|Service|Scope|Autowired)\s*\*/', next_line):
-                        continue
-                    # Skip single-line comments
-                    if next_line.startswith('//'):
-                        continue
-                    
-                    # Check for class declaration
-                    class_match = re.search(class_pattern, next_line)
-                    if class_match:
-                        class_found = True
-                        class_name = class_match.group(1)
-                        break
-                    
-                    # Stop if we hit a blank line or something that's not an annotation/macro
-                    if not next_line:
-                        continue
-                    # Allow annotations and common macros to continue searching
-                    is_annotation_or_macro = (
-                        re.search(r'/\*\s*@(Component|Service|Scope|Autowired)\s*\*/', next_line) or
-                        next_line.startswith(('COMPONENT', 'SCOPE', 'VALIDATE', 'AUTOWIRED'))
-                    )
-                    if not is_annotation_or_macro:
-                        break
+            for next_line in (line.strip() for line in lines[line_index:line_index + 11]):
+                context_lines.append(next_line)
+                
+                # Skip other comments that aren't annotations
+                # But allow /* @Component */, /* @Service */, /* @Scope */, /* @Autowired */ annotations to be processed
+                if next_line.startswith('/*') and not _CONTINUATION_ANNOTATION_RE.search(next_line):
+                    continue
+                # Skip single-line comments
+                if next_line.startswith('//'):
+                    continue
+                
+                # Check for class declaration
+                class_match = _CLASS_RE.search(next_line)
+                if class_match:
+                    class_found = True
+                    class_name = class_match.group(1)
+                    break
+                
+                # Stop if we hit a blank line or something that's not an annotation/macro
+                if not next_line:
+                    continue
+                # Allow annotations and common macros to continue searching
+                is_annotation_or_macro = (
+                    _CONTINUATION_ANNOTATION_RE.search(next_line) or
+                    next_line.startswith(('COMPONENT', 'SCOPE', 'VALIDATE', 'AUTOWIRED'))
+                )
+                if not is_annotation_or_macro:
+                    break
             
             component_macros.append({
                 'macro': annotation_text,
@@ -128,28 +212,26 @@ def find_component_macros(file_path: str) -> List[Dict[str, str]]:
             })
         
         # Check for legacy COMPONENT macro (for backward compatibility)
-        if re.match(r'^COMPONENT\s*$', stripped_line) and not stripped_line.startswith('//') and not stripped_line.startswith('/*'):
+        if _LEGACY_COMPONENT_RE.match(stripped_line) and not stripped_line.startswith('//') and not stripped_line.startswith('/*'):
             # Look ahead for class declaration
             class_found = False
             class_name = ""
             context_lines = []
             
-            for i in range(line_num, min(line_num + 11, len(lines) + 1)):
-                if i <= len(lines):
-                    next_line = lines[i - 1].strip()
-                    context_lines.append(next_line)
-                    
-                    if next_line.startswith('//') or next_line.startswith('/*'):
-                        continue
-                    
-                    class_match = re.search(class_pattern, next_line)
-                    if class_match:
-                        class_found = True
-                        class_name = class_match.group(1)
-                        break
-                    
-                    if not next_line or (next_line and not next_line.startswith(('COMPONENT', 'SCOPE', 'VALIDATE'))):
-                        break
+            for next_line in (line.strip() for line in lines[line_index:line_index + 11]):
+                context_lines.append(next_line)
+                
+                if next_line.startswith('//') or next_line.startswith('/*'):
+                    continue
+                
+                class_match = _CLASS_RE.search(next_line)
+                if class_match:
+                    class_found = True
+                    class_name = class_match.group(1)
+                    break
+                
+                if not next_line or (next_line and not next_line.startswith(('COMPONENT', 'SCOPE', 'VALIDATE'))):
+                    break
             
             component_macros.append({
                 'macro': 'COMPONENT',
@@ -175,32 +257,31 @@ def check_component_macro_exists(file_path: str) -> bool:
         True if active @Component or @Service annotation or COMPONENT macro is found, False otherwise
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-        
-        component_annotation_pattern = re.compile(r'/\*\s*@Component\s*\*/')
-        component_processed_pattern = re.compile(r'/\*--\s*@Component\s*--\*/')
-        service_annotation_pattern = re.compile(r'/\*\s*@Service\s*\*/')
-        service_processed_pattern = re.compile(r'/\*--\s*@Service\s*--\*/')
+        content = _read_component_source(file_path)
+        if content is None:
+            return False
+        lines = _LINE_RE.findall(content)
         
         # Check each line for @Component or @Service annotation or legacy COMPONENT macro
         for line in lines:
             stripped_line = line.strip()
             
+            processed, component_match, service_match = _match_component_annotations(stripped_line)
+            
             # Skip already processed annotations
-            if component_processed_pattern.search(stripped_line) or service_processed_pattern.search(stripped_line):
+            if processed:
                 continue
             
             # Skip other comments that aren't @Component or @Service annotations
             # But allow /* @Component */ or /* @Service */ annotations to be processed
-            if stripped_line.startswith('/*') and not component_annotation_pattern.search(stripped_line) and not service_annotation_pattern.search(stripped_line):
+            if stripped_line.startswith('/*') and not component_match and not service_match:
                 continue
             # Skip single-line comments
             if stripped_line.startswith('//'):
                 continue
                 
             # Check if line contains @Component or @Service annotation
-            if component_annotation_pattern.search(stripped_line) or service_annotation_pattern.search(stripped_line):
+            if component_match or service_match:
                 return True
             
             # Check for legacy COMPONENT macro (for backward compatibility)
@@ -215,6 +296,9 @@ def check_component_macro_exists(file_path: str) -> bool:
 def validate_component_macro_requirements(file_path: str) -> Dict[str, any]:
     """
     Comprehensive validation of COMPONENT macro requirements.
+    Results are cached per file path, modification time and size; see clear_cache().
+    The returned dictionary and its lists are copies, but the dictionaries in 'component_macros'
+    are shared with the cache and must be treated as read-only.
     
     Args:
         file_path: Path to the C++ file
@@ -222,14 +306,71 @@ def validate_component_macro_requirements(file_path: str) -> Dict[str, any]:
     Returns:
         Dictionary with validation results
     """
-    # Step 1: Get class names from the file
-    class_names = find_class_names(file_path)
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return _validate_component_macro_requirements(file_path)
+    
+    # Fresh dict and lists, so callers can add keys or items without altering the cached entry
+    cached = _validate_cached(file_path, stat_result.st_mtime_ns, stat_result.st_size)
+    return {key: list(value) if isinstance(value, list) else value for key, value in cached.items()}
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, any]:
+    """
+    Cached body of validate_component_macro_requirements(); mtime_ns and size only serve as cache key.
+    
+    Args:
+        file_path: Path to the C++ file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Dictionary with validation results
+    """
+    return _validate_component_macro_requirements(file_path)
+
+
+def clear_cache() -> None:
+    """
+    Drop all cached validation results.
+    Only needed by callers that rewrite files within the same modification time and size.
+    """
+    _validate_cached.cache_clear()
+
+
+def _validate_component_macro_requirements(file_path: str) -> Dict[str, any]:
+    """
+    Uncached body of validate_component_macro_requirements().
     
-    # Step 2: Get interface names from the file
-    interface_names = find_interface_names(file_path)
+    Args:
+        file_path: Path to the C++ file
+        
+    Returns:
+        Dictionary with validation results
+    """
+    try:
+        # Read once and share the text between the three finders
+        with open(file_path, 'r', encoding='utf-8') as file:
+            content = file.read()
+    except Exception:
+        content = None
     
-    # Step 3: Find COMPONENT macros
-    component_macros = find_component_macros(file_path)
+    if content is None:
+        # Let each finder report the unreadable file in its own way
+        class_names = find_class_names(file_path)
+        interface_names = find_interface_names(file_path)
+        component_macros = find_component_macros(file_path)
+    else:
+        # Step 1: Get class names from the file
+        class_names = find_class_names_from_text(content)
+        
+        # Step 2: Get interface names from the file
+        interface_names = find_interface_names_from_text(content)
+        
+        # Step 3: Find COMPONENT macros
+        component_macros = find_component_macros_from_text(content)
     
     # Step 4: Validate requirements
     has_classes = len(class_names) > 0
@@ -275,6 +416,12 @@ def check_multiple_files(file_paths: List[str]) -> Dict[str, Dict[str, any]]:
     Returns:
         Dictionary mapping file paths to validation results
     """
+    if len(file_paths) > _PARALLEL_MIN_FILES:
+        # Files are independent: validate them in parallel across CPU cores, keeping the input order
+        chunksize = max(1, len(file_paths) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor() as executor:
+            return dict(zip(file_paths, executor.map(validate_component_macro_requirements, file_paths, chunksize=chunksize)))
+    
     results = {}
     
     for file_path in file_paths:
@@ -309,13 +456,11 @@ def comment_component_macro(file_path: str) -> bool:
         True if file was modified successfully, False otherwise
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-        
-        component_annotation_pattern = re.compile(r'/\*\s*@Component\s*\*/')
-        component_processed_pattern = re.compile(r'/\*--\s*@Component\s*--\*/')
-        service_annotation_pattern = re.compile(r'/\*\s*@Service\s*\*/')
-        service_processed_pattern = re.compile(r'/\*--\s*@Service\s*--\*/')
+        content = _read_component_source(file_path)
+        if content is None:
+            # Nothing to process
+            return True
+        lines = _LINE_RE.findall(content)
         
         modified = False
         modified_lines = []
@@ -323,13 +468,14 @@ def comment_component_macro(file_path: str) -> bool:
         for i, line in enumerate(lines):
             stripped_line = line.strip()
             
+            processed, component_match, service_match = _match_component_annotations(stripped_line)
+            
             # Skip already processed annotations
-            if component_processed_pattern.search(stripped_line) or service_processed_pattern.search(stripped_line):
+            if processed:
                 modified_lines.append(line)
                 continue
             
             # Check if line contains @Component annotation
-            component_match = component_annotation_pattern.search(stripped_line)
             if component_match:
                 indent = len(line) - len(line.lstrip())
                 indent_str = line[:indent]
@@ -339,7 +485,6 @@ def comment_component_macro(file_path: str) -> bool:
                 continue
             
             # Check if line contains @Service annotation
-            service_match = service_annotation_pattern.search(stripped_line)
             if service_match:
                 indent = len(line) - len(line.lstrip())
                 indent_str = line[:indent]
@@ -349,7 +494,7 @@ def comment_component_macro(file_path: str) -> bool:
                 continue
             
             # Check for legacy COMPONENT macro (for backward compatibility)
-            if re.match(r'^COMPONENT\s*$', stripped_line):
+            if _LEGACY_COMPONENT_RE.match(stripped_line):
                 modified_lines.append('// ' + line)
                 modified = True
                 continue
@@ -521,11 +666,13 @@ def main():
 # Export functions for other scripts to import
 __all__ = [
     'find_component_macros',
+    'find_component_macros_from_text',
     'check_component_macro_exists',
     'validate_component_macro_requirements',
     'check_multiple_files',
     'comment_component_macro',
     'comment_component_macros_in_multiple_files',
+    'clear_cache',
     'main'
 ]
 
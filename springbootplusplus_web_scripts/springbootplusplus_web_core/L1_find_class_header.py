@@ -31,6 +31,23 @@ def find_class_header_file(class_name: str, search_root: str = ".", include_fold
     Returns:
         Path to the class header file, or None if not found
     """
+    all_files = collect_cpp_files(search_root, include_folders, exclude_folders)
+    return find_class_header_in_files(class_name, all_files)
+
+
+def collect_cpp_files(search_root: str = ".", include_folders: Optional[List[str]] = None, exclude_folders: Optional[List[str]] = None) -> List[str]:
+    """
+    Collect the deduplicated, resolved C++ files that class headers are searched in.
+    Callers looking up several classes can collect once and pass the list to find_class_header_in_files().
+    
+    Args:
+        search_root: Root directory to search for class headers
+        include_folders: List of folders to include in search (if None, search all)
+        exclude_folders: List of folders to exclude from search
+        
+    Returns:
+        List of absolute C++ file paths
+    """
     # Step 1: Get all C++ source files in the search directory with include/exclude options
     all_files_raw = find_cpp_files(
         root_dir=search_root,
@@ -47,6 +64,20 @@ def find_class_header_file(class_name: str, search_root: str = ".", include_fold
             seen_files.add(resolved)
             all_files.append(resolved)
     
+    return all_files
+
+
+def find_class_header_in_files(class_name: str, all_files: List[str]) -> Optional[str]:
+    """
+    Find the header file for a given class/interface name among already collected files.
+    
+    Args:
+        class_name: Name of the class/interface to search for
+        all_files: Absolute C++ file paths, as returned by collect_cpp_files()
+        
+    Returns:
+        Path to the class header file, or None if not found
+    """
     # Step 2: Find files that end with <class-name>.h or <class-name>.hpp (case insensitive)
     potential_headers = []
     class_name_lower = class_name.lower()
@@ -134,13 +165,14 @@ def find_class_headers_for_names(class_names: List[str], search_root: str = ".",
         Dictionary mapping class names to their header files
     """
     results = {}
+    all_files = collect_cpp_files(search_root, include_folders, exclude_folders)
     
     for class_name in class_names:
         # print(f"\n{'='*60}")
         # print(f"Processing: {class_name}")
         # print(f"{'='*60}")
         
-        class_header = find_class_header_file(class_name, search_root, include_folders, exclude_folders)
+        class_header = find_class_header_in_files(class_name, all_files)
         if class_header:
             results[class_name] = class_header
         else:
@@ -293,6 +325,8 @@ def find_interface_header_file(source_file: str, search_root: str = ".", include
 # Export functions for other scripts to import
 __all__ = [
     'find_class_header_file',
+    'collect_cpp_files',
+    'find_class_header_in_files',
     'find_class_headers_for_names', 
     'get_class_header_for_name',
     'get_class_headers_for_names',
@@ -38,8 +38,8 @@ def get_file_scope(file_path: str) -> str:
     if scope_macros:
         # Use the first @Scope annotation found (assuming one per file)
         scope_macro = scope_macros[0]
-        base_scope = scope_macro['scope_value']
-        # print(f"Found @Scope annotation: {scope_macro['macro']}")
+        base_scope = scope_macro.scope_value
+        # print(f"Found @Scope annotation: {scope_macro.macro}")
         # print(f"Base scope: {base_scope}")
     else:
         # print(f"No @Scope annotation found, using default: {base_scope}")
@@ -84,7 +84,7 @@ def get_file_scope_info(file_path: str) -> Dict[str, Any]:
     
     if scope_macros:
         scope_macro = scope_macros[0]
-        base_scope = scope_macro['scope_value']
+        base_scope = scope_macro.scope_value
         scope_source = "annotation"
     
     # Step 4: Determine final scope
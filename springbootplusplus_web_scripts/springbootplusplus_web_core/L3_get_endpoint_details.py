@@ -6,7 +6,9 @@ inside the class, extracts function details, and combines with base URL to form
 """
 
 import re
+import os
 import argparse
+import functools
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
 
@@ -15,10 +17,39 @@ def find_class_and_interface(file_path: str) -> Optional[Dict[str, str]]:
     """
     Find class name and interface name from class declaration.
     Handles both 'class Xyz : public Interface' and 'class Xyz final : public Interface'.
+    Results are cached per file path, modification time and size, so repeated lookups of an
+    unchanged file (e.g. by L5_generate_all_endpoints and L6_generate_code_for_all_sources) parse it once.
     
     Args:
         file_path: Path to the C++ file
         
+    Returns:
+        Dictionary with 'class_name' and 'interface_name', or None if not found
+    """
+    try:
+        stat_result = os.stat(file_path)
+    except FileNotFoundError:
+        # print(f"Error: File '{file_path}' not found")
+        return None
+    except Exception as e:
+        # print(f"Error reading file '{file_path}': {e}")
+        return None
+    
+    class_info = _find_class_and_interface_cached(file_path, stat_result.st_mtime_ns, stat_result.st_size)
+    # Hand out a copy so callers cannot alter the cached entry
+    return dict(class_info) if class_info else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_class_and_interface_cached(file_path: str, mtime_ns: int, size: int) -> Optional[Dict[str, str]]:
+    """
+    Cached body of find_class_and_interface(); mtime_ns and size only serve as cache key.
+    
+    Args:
+        file_path: Path to the C++ file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
     Returns:
         Dictionary with 'class_name' and 'interface_name', or None if not found
     """
@@ -757,6 +788,86 @@ def main():
     return result
 
 
+def get_mapping_variable_name(http_method: str) -> str:
+    """
+    Get the mapping variable name based on HTTP method.
+    
+    Args:
+        http_method: HTTP method (GET, POST, PUT, DELETE, PATCH)
+        
+    Returns:
+        Mapping variable name (e.g., "getMappings", "postMappings", etc.)
+    """
+    method_lower = http_method.lower()
+    return f"{method_lower}Mappings"
+
+
+def parse_response_entity_type(return_type: str) -> Tuple[bool, Optional[str]]:
+    """
+    Parse return type to check if it's ResponseEntity<T> and extract the entity type.
+    
+    Args:
+        return_type: Return type string (e.g., "ResponseEntity<StdString>", "ResponseEntity<Int>", "int")
+        
+    Returns:
+        Tuple of (is_response_entity, entity_type)
+        - is_response_entity: True if return type is ResponseEntity<T>, False otherwise
+        - entity_type: The entity type T if it's ResponseEntity<T>, None otherwise
+    """
+    cleaned = return_type.strip()
+    
+    # Check if it starts with "ResponseEntity<" (case-insensitive)
+    if not cleaned.lower().startswith("responseentity<"):
+        return (False, None)
+    
+    # Find the opening and closing angle brackets
+    start_idx = cleaned.find('<')
+    if start_idx == -1:
+        return (False, None)
+    
+    # Find matching closing bracket
+    bracket_count: int = 0
+    end_idx: int = -1
+    for i in range(start_idx, len(cleaned)):
+        if cleaned[i] == '<':
+            bracket_count += 1
+        elif cleaned[i] == '>':
+            bracket_count -= 1
+            if bracket_count == 0:
+                end_idx = i
+                break
+    
+    if end_idx == -1:
+        return (False, None)
+    
+    # Extract the entity type (everything between < and >)
+    entity_type = cleaned[start_idx + 1:end_idx].strip()
+    
+    # Remove any C++ keywords from the entity type
+    keywords_to_remove = ['public', 'private', 'protected', 'virtual', 'static', 'const', 'override']
+    words = entity_type.split()
+    actual_type_words = [w for w in words if w.lower() not in keywords_to_remove]
+    entity_type = ' '.join(actual_type_words).strip()
+    
+    return (True, entity_type)
+
+
+def clean_return_type(return_type: str) -> str:
+    """
+    Remove common C++ keywords (public, virtual, const, etc.) from a return type.
+    
+    Args:
+        return_type: Return type string (e.g., "virtual int", "MyReturnDto")
+        
+    Returns:
+        The actual type with keywords removed
+    """
+    keywords_to_remove = ['public', 'private', 'protected', 'virtual', 'static', 'const', 'override']
+    words = return_type.strip().split()
+    actual_type_words = [w for w in words if w.lower() not in keywords_to_remove]
+    return ' '.join(actual_type_words).strip()
+
+
 def format_endpoint_with_advanced_signature(endpoint: Dict[str, Any]) -> Dict[str, Any]:
     """
     Format endpoint information with advanced function signature parsing.
@@ -774,7 +885,14 @@ def format_endpoint_with_advanced_signature(endpoint: Dict[str, Any]) -> Dict[st
             'endpoint_type': str,              # "POST", "PUT", "GET", "DELETE", "PATCH"
             'return_type': str,                # e.g., "Void", "MyReturnDto", "int"
             'function_name': str,              # e.g., "SomeFun", "CreateUser"
-            'parameters': List[Dict]           # List of parameter dictionaries (maintains order)
+            'parameters': List[Dict],          # List of parameter dictionaries (maintains order)
+            
+            # Precomputed for the L4 code generator:
+            '_mapping_var': str,               # e.g., "postMappings"
+            '_cleaned_return_type': str,       # Return type with C++ keywords removed
+            '_is_void': bool,                  # True if return type is void/Void
+            '_is_response_entity': bool,       # True if return type is ResponseEntity<T>
+            '_entity_type': Optional[str]      # T for ResponseEntity<T>, otherwise None
         }
     """
     # Extract or use existing parameters list
@@ -786,13 +904,24 @@ def format_endpoint_with_advanced_signature(endpoint: Dict[str, Any]) -> Dict[st
         # For now, we'll rely on the parameters already being parsed
         pass
     
+    http_method = endpoint.get('http_method', '')  # Already in uppercase (GET, POST, etc.)
+    return_type = endpoint.get('return_type', '')
+    # Derived once here, so the L4 code generator can skip this per endpoint
+    cleaned_return_type = clean_return_type(return_type)
+    is_response_entity, entity_type = parse_response_entity_type(cleaned_return_type)
+    
     return {
         'controller_interface_name': endpoint.get('interface_name', ''),
         'complete_url': endpoint.get('endpoint_url', ''),
-        'endpoint_type': endpoint.get('http_method', ''),  # Already in uppercase (GET, POST, etc.)
-        'return_type': endpoint.get('return_type', ''),
+        'endpoint_type': http_method,
+        'return_type': return_type,
         'function_name': endpoint.get('function_name', ''),
-        'parameters': parameters
+        'parameters': parameters,
+        '_mapping_var': get_mapping_variable_name(http_method),
+        '_cleaned_return_type': cleaned_return_type,
+        '_is_void': cleaned_return_type.lower() == "void",
+        '_is_response_entity': is_response_entity,
+        '_entity_type': entity_type
     }
 
 
@@ -844,6 +973,9 @@ __all__ = [
     '_parse_single_parameter',
     'find_mapping_endpoints',
     'get_endpoint_details',
+    'get_mapping_variable_name',
+    'parse_response_entity_type',
+    'clean_return_type',
     'format_endpoint_with_advanced_signature',
     'get_endpoint_with_advanced_signature',
     'display_endpoint_details',
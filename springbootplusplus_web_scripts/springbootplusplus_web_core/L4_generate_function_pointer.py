@@ -6,71 +6,75 @@ function pointer template based on the HTTP method (GET, POST, PUT, DELETE, PATC
 """
 
 import argparse
-from typing import Dict, Optional, List, Any, Tuple
+import functools
+from typing import Dict, Optional, List, Any, Tuple, BinaryIO, FrozenSet
 
+# Return-type helpers shared with format_endpoint_with_advanced_signature()
+from L3_get_endpoint_details import get_mapping_variable_name, parse_response_entity_type, clean_return_type
 
-def get_mapping_variable_name(http_method: str) -> str:
-    """
-    Get the mapping variable name based on HTTP method.
-    
-    Args:
-        http_method: HTTP method (GET, POST, PUT, DELETE, PATCH)
-        
-    Returns:
-        Mapping variable name (e.g., "getMappings", "postMappings", etc.)
-    """
-    method_lower = http_method.lower()
-    return f"{method_lower}Mappings"
 
+# Placeholder values for "no first argument" (compared after strip/lower)
+_EMPTY_ARG_TOKENS: FrozenSet[str] = frozenset({'', 'none', '(none)'})
 
-def parse_response_entity_type(return_type: str) -> Tuple[bool, Optional[str]]:
+# Advanced lambda signatures keyed by (uses payload, uses variables); unused parameters are commented out
+_ADVANCED_LAMBDA_SIGNATURES: Dict[Tuple[bool, bool], str] = {
+    (True, True): "[](CStdString payload, StdMap<StdString, StdString> variables) -> IHttpResponsePtr",
+    (True, False): "[](CStdString payload, StdMap<StdString, StdString> /*variables*/) -> IHttpResponsePtr",
+    (False, True): "[](CStdString /*payload*/, StdMap<StdString, StdString> variables) -> IHttpResponsePtr",
+    (False, False): "[](CStdString /*payload*/, StdMap<StdString, StdString> /*variables*/) -> IHttpResponsePtr",
+}
+
+
+def _emit_controller_lambda(
+    mapping_var: str,
+    url: str,
+    lambda_signature: str,
+    interface_name: str,
+    function_name: str,
+    cleaned_return_type: str,
+    is_void: bool,
+    is_response_entity: bool,
+    entity_type: Optional[str],
+    call_args_str: str
+) -> str:
     """
-    Parse return type to check if it's ResponseEntity<T> and extract the entity type.
+    Emit the mapping lambda that fetches the controller and converts its result to a response.
     
     Args:
-        return_type: Return type string (e.g., "ResponseEntity<StdString>", "ResponseEntity<Int>", "int")
+        mapping_var: Mapping variable name (e.g., "getMappings")
+        url: Endpoint URL
+        lambda_signature: Lambda parameter list and return type
+        interface_name: Controller interface name (e.g., "ITestController")
+        function_name: Controller function to call
+        cleaned_return_type: Return type with C++ keywords removed
+        is_void: True if the function returns void
+        is_response_entity: True if the function returns ResponseEntity<T>
+        entity_type: T for ResponseEntity<T>
+        call_args_str: Comma-separated call arguments (empty for no arguments)
         
     Returns:
-        Tuple of (is_response_entity, entity_type)
-        - is_response_entity: True if return type is ResponseEntity<T>, False otherwise
-        - entity_type: The entity type T if it's ResponseEntity<T>, None otherwise
+        Generated function pointer code as string
     """
-    cleaned = return_type.strip()
-    
-    # Check if it starts with "ResponseEntity<" (case-insensitive)
-    if not cleaned.lower().startswith("responseentity<"):
-        return (False, None)
-    
-    # Find the opening and closing angle brackets
-    start_idx = cleaned.find('<')
-    if start_idx == -1:
-        return (False, None)
-    
-    # Find matching closing bracket
-    bracket_count = 0
-    end_idx = -1
-    for i in range(start_idx, len(cleaned)):
-        if cleaned[i] == '<':
-            bracket_count += 1
-        elif cleaned[i] == '>':
-            bracket_count -= 1
-            if bracket_count == 0:
-                end_idx = i
-                break
-    
-    if end_idx == -1:
-        return (False, None)
+    code = f"{mapping_var}[\"{url}\"] = {lambda_signature} {{\n"
+    code += "//                 AUTOWIRED\n"
+    code += f"    {interface_name}Ptr controller = Implementation<{interface_name}>::type::GetInstance();\n"
     
-    # Extract the entity type (everything between < and >)
-    entity_type = cleaned[start_idx + 1:end_idx].strip()
+    if is_void:
+        # For void return types, call controller method and return CreateOkResponse() (no body)
+        code += f"    controller->{function_name}({call_args_str});\n"
+        code += "    return ResponseEntityConverter::CreateOkResponse();\n"
+    elif is_response_entity:
+        # For ResponseEntity<T> return types, store return value and use ToHttpResponse<EntityType>(returnValue)
+        code += f"    {cleaned_return_type} returnValue = controller->{function_name}({call_args_str});\n"
+        code += f"    return ResponseEntityConverter::ToHttpResponse<{entity_type}>(returnValue);\n"
+    else:
+        # For non-void, non-ResponseEntity return types, store return value and use CreateOkResponse<T>(returnValue)
+        code += f"    {cleaned_return_type} returnValue = controller->{function_name}({call_args_str});\n"
+        code += f"    return ResponseEntityConverter::CreateOkResponse<{cleaned_return_type}>(returnValue);\n"
     
-    # Remove any C++ keywords from the entity type
-    keywords_to_remove = ['public', 'private', 'protected', 'virtual', 'static', 'const', 'override']
-    words = entity_type.split()
-    actual_type_words = [w for w in words if w.lower() not in keywords_to_remove]
-    entity_type = ' '.join(actual_type_words).strip()
+    code += "};"
     
-    return (True, entity_type)
+    return code
 
 
 def generate_function_pointer(
@@ -98,56 +102,22 @@ def generate_function_pointer(
     # Get the mapping variable name based on HTTP method
     mapping_var = get_mapping_variable_name(http_method)
     
-    # Clean return type: remove common C++ keywords (Public, Private, Protected, Virtual, etc.)
-    # and extract just the actual type
-    cleaned_return_type = return_type.strip()
-    # Remove common keywords that might appear before the actual type
-    keywords_to_remove = ['public', 'private', 'protected', 'virtual', 'static', 'const', 'override']
-    words = cleaned_return_type.split()
-    # Filter out keywords and keep only the actual type
-    actual_type_words = [w for w in words if w.lower() not in keywords_to_remove]
-    cleaned_return_type = ' '.join(actual_type_words).strip()
-    
-    # Check if return type is void or Void (case-insensitive)
+    # Clean return type and check if it is void or ResponseEntity<T>
+    cleaned_return_type = clean_return_type(return_type)
     is_void = cleaned_return_type.lower() == "void"
-    
-    # Check if return type is ResponseEntity<T>
     is_response_entity, entity_type = parse_response_entity_type(cleaned_return_type)
     
-    # Generate the function pointer code
-    # Return type is now IHttpResponsePtr instead of StdString
-    code = f"{mapping_var}[\"{url}\"] = [](CStdString arg) -> IHttpResponsePtr {{\n"
-    code += "//                 AUTOWIRED\n"
-    code += f"    {interface_name}Ptr controller = Implementation<{interface_name}>::type::GetInstance();\n"
-    
-    if is_void:
-        # For void return types, call controller method and return CreateOkResponse() (no body)
-        if first_arg_type and first_arg_type.lower() not in ["", "none", "(none)"]:
-            code += f"    controller->{function_name}(nayan::serializer::SerializationUtility::Deserialize<{first_arg_type}>(arg));\n"
-        else:
-            code += f"    controller->{function_name}();\n"
-        code += "    return ResponseEntityConverter::CreateOkResponse();\n"
-    elif is_response_entity:
-        # For ResponseEntity<T> return types, store return value and use ToHttpResponse<EntityType>(returnValue)
-        # Handle case where there's no argument (first_arg_type is empty or "none")
-        if first_arg_type and first_arg_type.lower() not in ["", "none", "(none)"]:
-            code += f"    {cleaned_return_type} returnValue = controller->{function_name}(nayan::serializer::SerializationUtility::Deserialize<{first_arg_type}>(arg));\n"
-        else:
-            code += f"    {cleaned_return_type} returnValue = controller->{function_name}();\n"
-        code += f"    return ResponseEntityConverter::ToHttpResponse<{entity_type}>(returnValue);\n"
+    # Empty / "none" first argument type means the function takes no argument
+    if first_arg_type and first_arg_type.strip().lower() not in _EMPTY_ARG_TOKENS:
+        call_args_str = f"nayan::serializer::SerializationUtility::Deserialize<{first_arg_type}>(arg)"
     else:
-        # For non-void, non-ResponseEntity return types, store return value and use CreateOkResponse<T>(returnValue)
-        # Handle case where there's no argument (first_arg_type is empty or "none")
-        if first_arg_type and first_arg_type.lower() not in ["", "none", "(none)"]:
-            code += f"    {cleaned_return_type} returnValue = controller->{function_name}(nayan::serializer::SerializationUtility::Deserialize<{first_arg_type}>(arg));\n"
-        else:
-            code += f"    {cleaned_return_type} returnValue = controller->{function_name}();\n"
-        
-        code += f"    return ResponseEntityConverter::CreateOkResponse<{cleaned_return_type}>(returnValue);\n"
-    
-    code += "};"
+        call_args_str = ""
     
-    return code
+    # Return type is now IHttpResponsePtr instead of StdString
+    return _emit_controller_lambda(
+        mapping_var, url, "[](CStdString arg) -> IHttpResponsePtr", interface_name,
+        function_name, cleaned_return_type, is_void, is_response_entity, entity_type, call_args_str
+    )
 
 
 def generate_function_pointer_advanced(formatted_endpoint: Dict[str, Any]) -> str:
@@ -169,6 +139,8 @@ def generate_function_pointer_advanced(formatted_endpoint: Dict[str, Any]) -> st
                 'function_name': str,              # e.g., "SomeFun", "CreateUser"
                 'parameters': List[Dict]           # List of parameter dictionaries
             }
+            The precomputed '_mapping_var', '_cleaned_return_type', '_is_void',
+            '_is_response_entity' and '_entity_type' keys are used when present.
     
     Returns:
         Generated function pointer code as string
@@ -176,120 +148,96 @@ def generate_function_pointer_advanced(formatted_endpoint: Dict[str, Any]) -> st
     # Extract endpoint information
     controller_interface = formatted_endpoint.get('controller_interface_name', '')
     complete_url = formatted_endpoint.get('complete_url', '')
-    endpoint_type = formatted_endpoint.get('endpoint_type', '').upper()  # Ensure uppercase
-    return_type = formatted_endpoint.get('return_type', '')
     function_name = formatted_endpoint.get('function_name', '')
     parameters = formatted_endpoint.get('parameters', [])
     
-    # Get the mapping variable name based on HTTP method
-    mapping_var = get_mapping_variable_name(endpoint_type)
-    
-    # Clean return type: remove common C++ keywords
-    cleaned_return_type = return_type.strip()
-    keywords_to_remove = ['public', 'private', 'protected', 'virtual', 'static', 'const', 'override']
-    words = cleaned_return_type.split()
-    actual_type_words = [w for w in words if w.lower() not in keywords_to_remove]
-    cleaned_return_type = ' '.join(actual_type_words).strip()
-    
-    # Check if return type is void or Void (case-insensitive)
-    is_void = cleaned_return_type.lower() == "void"
+    if '_cleaned_return_type' in formatted_endpoint:
+        # Return type details were already derived by format_endpoint_with_advanced_signature()
+        mapping_var = formatted_endpoint['_mapping_var']
+        cleaned_return_type = formatted_endpoint['_cleaned_return_type']
+        is_void = formatted_endpoint['_is_void']
+        is_response_entity = formatted_endpoint['_is_response_entity']
+        entity_type = formatted_endpoint['_entity_type']
+    else:
+        endpoint_type = formatted_endpoint.get('endpoint_type', '').upper()  # Ensure uppercase
+        mapping_var = get_mapping_variable_name(endpoint_type)
+        cleaned_return_type = clean_return_type(formatted_endpoint.get('return_type', ''))
+        is_void = cleaned_return_type.lower() == "void"
+        is_response_entity, entity_type = parse_response_entity_type(cleaned_return_type)
+    
+    # Parameters as a hashable (type, class_name, subType) tuple so the generation can be cached
+    params = tuple(
+        (param.get('type', ''), param.get('class_name', ''), param.get('subType', ''))
+        for param in parameters
+    )
     
-    # Check if return type is ResponseEntity<T>
-    is_response_entity, entity_type = parse_response_entity_type(cleaned_return_type)
+    return _generate_function_pointer_advanced_cached(
+        mapping_var, complete_url, controller_interface, function_name,
+        cleaned_return_type, is_void, is_response_entity, entity_type, params
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _generate_function_pointer_advanced_cached(
+    mapping_var: str,
+    complete_url: str,
+    controller_interface: str,
+    function_name: str,
+    cleaned_return_type: str,
+    is_void: bool,
+    is_response_entity: bool,
+    entity_type: Optional[str],
+    params: Tuple[Tuple[str, str, str], ...]
+) -> str:
+    """
+    Cached body of generate_function_pointer_advanced(); identical endpoints are generated once.
     
-    # Check which parameters are used
+    Args:
+        params: Tuple of (type, class_name, subType) for each parameter, in order
+        (remaining arguments as in _emit_controller_lambda())
+        
+    Returns:
+        Generated function pointer code as string
+    """
+    # Build function call arguments and track which lambda parameters are used
     has_request_body = False
     has_path_variable = False
-    
-    for param in parameters:
-        param_type = param.get('type', '')
-        if param_type == 'RequestBody':
-            has_request_body = True
-        elif param_type == 'PathVariable':
-            has_path_variable = True
-        else:
-            # Fallback: treat as RequestBody
-            has_request_body = True
-    
-    # Generate lambda signature with commented unused parameters
-    # Return type is now IHttpResponsePtr instead of StdString
-    if has_request_body and has_path_variable:
-        # Both are used
-        lambda_signature = "[](CStdString payload, StdMap<StdString, StdString> variables) -> IHttpResponsePtr"
-    elif has_request_body and not has_path_variable:
-        # Only payload is used
-        lambda_signature = "[](CStdString payload, StdMap<StdString, StdString> /*variables*/) -> IHttpResponsePtr"
-    elif not has_request_body and has_path_variable:
-        # Only variables is used
-        lambda_signature = "[](CStdString /*payload*/, StdMap<StdString, StdString> variables) -> IHttpResponsePtr"
-    else:
-        # Neither is used (no parameters)
-        lambda_signature = "[](CStdString /*payload*/, StdMap<StdString, StdString> /*variables*/) -> IHttpResponsePtr"
-    
-    # Generate the function pointer code
-    code = f"{mapping_var}[\"{complete_url}\"] = {lambda_signature} {{\n"
-    code += "//                 AUTOWIRED\n"
-    code += f"    {controller_interface}Ptr controller = Implementation<{controller_interface}>::type::GetInstance();\n"
-    
-    # Build function call arguments
     function_args = []
     
-    for param in parameters:
-        param_type = param.get('type', '')
-        param_class_name = param.get('class_name', '')
-        param_sub_type = param.get('subType', '')  # Path variable name for PathVariable
-        
-        if param_type == 'RequestBody':
-            # Deserialize from payload
-            function_args.append(f"nayan::serializer::SerializationUtility::Deserialize<{param_class_name}>(payload)")
-        elif param_type == 'PathVariable':
+    for param_type, param_class_name, param_sub_type in params:
+        if param_type == 'PathVariable':
+            has_path_variable = True
             # Extract from variables map and convert to type
-            # Strip 'const' and other qualifiers for ConvertToType template parameter
             # ConvertToType needs the base type, not const-qualified
             type_for_conversion = param_class_name.strip()
-            # Remove 'const' keyword if present
             if type_for_conversion.startswith('const '):
                 type_for_conversion = type_for_conversion[6:].strip()
-            # Use ConvertToType to convert the string value to the appropriate type
             # Qualify with class name since it's a member function template
             function_args.append(f"HttpRequestDispatcher::ConvertToType<{type_for_conversion}>(variables[\"{param_sub_type}\"])")
         else:
-            # Fallback: treat as RequestBody
+            # RequestBody (and fallback for unknown types): deserialize from payload
+            has_request_body = True
             function_args.append(f"nayan::serializer::SerializationUtility::Deserialize<{param_class_name}>(payload)")
     
-    # Generate function call
-    if is_void:
-        # For void return types, call controller method and return CreateOkResponse() (no body)
-        if function_args:
-            args_str = ", ".join(function_args)
-            code += f"    controller->{function_name}({args_str});\n"
-        else:
-            code += f"    controller->{function_name}();\n"
-        code += "    return ResponseEntityConverter::CreateOkResponse();\n"
-    elif is_response_entity:
-        # For ResponseEntity<T> return types, store return value and use ToHttpResponse<EntityType>(returnValue)
-        if function_args:
-            args_str = ", ".join(function_args)
-            code += f"    {cleaned_return_type} returnValue = controller->{function_name}({args_str});\n"
-        else:
-            code += f"    {cleaned_return_type} returnValue = controller->{function_name}();\n"
-        code += f"    return ResponseEntityConverter::ToHttpResponse<{entity_type}>(returnValue);\n"
-    else:
-        # For non-void, non-ResponseEntity return types, store return value and use CreateOkResponse<T>(returnValue)
-        if function_args:
-            args_str = ", ".join(function_args)
-            code += f"    {cleaned_return_type} returnValue = controller->{function_name}({args_str});\n"
-        else:
-            code += f"    {cleaned_return_type} returnValue = controller->{function_name}();\n"
-        code += f"    return ResponseEntityConverter::CreateOkResponse<{cleaned_return_type}>(returnValue);\n"
-    
-    code += "};"
+    # Lambda signature with unused parameters commented out
+    lambda_signature = _ADVANCED_LAMBDA_SIGNATURES[(has_request_body, has_path_variable)]
     
-    return code
+    return _emit_controller_lambda(
+        mapping_var, complete_url, lambda_signature, controller_interface,
+        function_name, cleaned_return_type, is_void, is_response_entity, entity_type,
+        ", ".join(function_args)
+    )
 
 
-def main():
-    """Main function to handle command line arguments and generate function pointer code."""
+def main(output_fh: Optional[BinaryIO] = None) -> str:
+    """
+    Main function to handle command line arguments and generate function pointer code.
+    
+    Args:
+        output_fh: Optional already-open binary file handle. When given, the generated
+                   code is written to it instead of opening --output, so callers
+                   generating many endpoints can keep a single file open.
+    """
     parser = argparse.ArgumentParser(
         description="Generate function pointer code for HTTP mapping endpoints"
     )
@@ -342,11 +290,12 @@ def main():
     )
     
     # Output the generated code
-    if args.output:
+    if output_fh is not None:
+        output_fh.write(generated_code.encode('utf-8') + b'\n')
+    elif args.output:
         try:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(generated_code)
-                f.write('\n')
+            with open(args.output, 'wb') as f:
+                f.write(generated_code.encode('utf-8') + b'\n')
             # print(f"Generated code saved to: {args.output}")
         except Exception as e:
             # print(f"Error writing to file '{args.output}': {e}")
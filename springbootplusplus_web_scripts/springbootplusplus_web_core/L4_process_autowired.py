@@ -12,168 +12,227 @@ This script:
 
 import re
 import argparse
+import functools
+import io
+import mmap
+import os
 import sys
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Pattern
 
 # Import our utility scripts
 try:
-    from find_class_names import get_class_names_from_file
+    from find_class_names import find_class_names_from_text
 except ImportError:
     # print("Error: Could not import find_class_names.py")
     sys.exit(1)
 
 
-def find_autowired_macros(file_path):
+# Classifies a line in one search: already processed annotation (/*--@Autowired--*/),
+# @Autowired annotation (/* @Autowired */ or /*@Autowired*/), or legacy AUTOWIRED macro
+_CLASSIFY_RE = re.compile(
+    r'(?P<proc>/\*--\s*@Autowired\s*--\*/)'
+    r'|(?P<ann>/\*\s*@Autowired\s*\*/)'
+    r'|(?P<legacy>^\s*AUTOWIRED\s*$)'
+)
+# Pattern for an already processed annotation (/*--@Autowired--*/)
+_AUTOWIRED_PROC_RE = re.compile(r'/\*--\s*@Autowired\s*--\*/')
+# TypePtr varName [= default_value]
+_PARAM_RE = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*Ptr)\s+([A-Za-z_][A-Za-z0-9_]*)\s*(?:=.*)?$')
+# Below this many files, starting worker processes costs more than process_multiple_files() saves
+_PARALLEL_MIN_FILES = 32
+
+
+@functools.lru_cache(maxsize=None)
+def _constructor_start_re(class_name):
+    """Compiled pattern for the start of a constructor of class_name (allows explicit, inline, etc.)."""
+    return re.compile(rf'^\s*(?:[A-Za-z_][A-Za-z0-9_]*\s+)*{re.escape(class_name)}\s*\(')
+
+
+# Class names per (file path, mtime_ns), so unchanged files are not re-parsed
+_class_names_cache = {}
+_CLASS_NAMES_CACHE_SIZE = 4096
+
+
+def _get_class_names_cached(file_path, mtime_ns, lines):
     """
-    Find all @Autowired annotations in the file that are not processed.
+    Get class names for a file, reusing the previous result while the file is unchanged.
     
+    Args:
+        file_path (str): Path to the C++ file
+        mtime_ns (int): Modification time of the file when lines were read
+        lines (list): Lines of the file (parsed only on a cache miss)
+        
     Returns:
-        list: List of tuples (line_number, line_content, match_info)
+        list: Class names found in the file
     """
-    autowired_macros = []
+    key = (file_path, mtime_ns)
+    class_names = _class_names_cache.get(key)
+    if class_names is None:
+        class_names = find_class_names_from_text(''.join(lines))
+        if len(_class_names_cache) >= _CLASS_NAMES_CACHE_SIZE:
+            _class_names_cache.clear()
+        _class_names_cache[key] = class_names
+    return class_names
+
+
+@dataclass
+class FileContext:
+    """
+    Per-file state shared by the scanning helpers.
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
+    Lines are stripped once here so the annotation scan and the constructor
+    look-ahead do not each call .strip() on the same lines again.
+    """
+    __slots__ = ('path', 'lines', 'stripped', 'class_name', 'ctor_re')
+    
+    path: str
+    lines: List[str]
+    stripped: List[str]
+    class_name: Optional[str]
+    ctor_re: Optional[Pattern]
+    
+    @classmethod
+    def from_lines(cls, path, lines, class_name=None):
+        """
+        Build a context for already-read file lines.
         
-        # Pattern for @Autowired annotation (search for /* @Autowired */ or /*@Autowired*/)
-        autowired_annotation_pattern = re.compile(r'/\*\s*@Autowired\s*\*/')
-        autowired_processed_pattern = re.compile(r'/\*--\s*@Autowired\s*--\*/')
-            
-        for line_num, line in enumerate(lines, 1):
-            stripped_line = line.strip()
-            
-            # Skip empty lines
-            if not stripped_line:
-                continue
+        Args:
+            path (str): Path to the C++ file ('' when the lines are not from a file)
+            lines (list): All lines in the file
+            class_name (str): Name of the class to search constructors for (optional)
             
-            # Skip already processed annotations
-            if autowired_processed_pattern.search(stripped_line):
-                continue
-                
-            # Skip other comments that aren't @Autowired annotations
-            # But allow /* @Autowired */ annotations to be processed
-            if stripped_line.startswith('/*') and not autowired_annotation_pattern.search(stripped_line):
-                continue
-            # Skip single-line comments
-            if stripped_line.startswith('//'):
-                continue
-                
-            # Find @Autowired annotation
-            autowired_match = autowired_annotation_pattern.search(stripped_line)
-            if autowired_match:
-                # Look at the next line for the variable declaration
-                if line_num < len(lines):
-                    next_line = lines[line_num].strip()
-                    # Parse the next line for variable declaration
-                    var_match = parse_variable_declaration(next_line)
-                    if var_match:
-                        autowired_macros.append({
-                            'type': 'variable',
-                            'line_number': line_num,
-                            'line_content': line.rstrip(),
-                            'next_line_number': line_num + 1,
-                            'next_line_content': lines[line_num].rstrip(),
-                            'variable_type': var_match['variable_type'],
-                            'object_name': var_match['object_name'],
-                            'variable_base_type': var_match['variable_base_type']
-                        })
-            
-            # Check for legacy AUTOWIRED macro (for backward compatibility)
-            if re.match(r'^\s*AUTOWIRED\s*$', stripped_line):
-                if line_num < len(lines):
-                    next_line = lines[line_num].strip()
-                    var_match = parse_variable_declaration(next_line)
-                    if var_match:
-                        autowired_macros.append({
-                            'type': 'variable',
-                            'line_number': line_num,
-                            'line_content': line.rstrip(),
-                            'next_line_number': line_num + 1,
-                            'next_line_content': lines[line_num].rstrip(),
-                            'variable_type': var_match['variable_type'],
-                            'object_name': var_match['object_name'],
-                            'variable_base_type': var_match['variable_base_type']
-                        })
-                        
-    except Exception as e:
-        # print(f"Error reading file {file_path}: {e}")
-        return []
+        Returns:
+            FileContext: Context with stripped lines and the constructor start pattern
+        """
+        return cls(
+            path=path,
+            lines=lines,
+            stripped=[line.strip() for line in lines],
+            class_name=class_name,
+            ctor_re=_constructor_start_re(class_name) if class_name else None
+        )
+
+
+def find_all_autowired(lines, class_name=None):
+    """
+    Find all unprocessed @Autowired annotations in a single pass over the file.
+    
+    An annotation (or legacy AUTOWIRED macro) followed by a variable declaration is
+    recorded as a variable; otherwise, if class_name is given, the first one followed
+    by a constructor of that class is recorded as the constructor.
+    
+    Args:
+        lines (list): All lines in the file
+        class_name (str): Name of the class to search constructors for (optional)
         
-    return autowired_macros
+    Returns:
+        tuple: (list of variable macro_info dicts, constructor macro_info dict or None)
+    """
+    return _find_all_autowired_in(FileContext.from_lines('', lines, class_name))
 
 
-def find_autowired_constructor(file_path, class_name):
+def _find_all_autowired_in(ctx):
     """
-    Find @Autowired constructor for the given class.
+    Single-pass @Autowired scan over a FileContext (see find_all_autowired).
     
     Args:
-        file_path (str): Path to the C++ file
-        class_name (str): Name of the class to search for
+        ctx (FileContext): Context of the file to scan
         
     Returns:
-        dict: Constructor info or None if not found
+        tuple: (list of variable macro_info dicts, constructor macro_info dict or None)
     """
+    autowired_macros = []
+    autowired_constructor = None
+    lines = ctx.lines
+    stripped = ctx.stripped
+    
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-        
-        # Pattern for @Autowired annotation (search for /* @Autowired */ or /*@Autowired*/)
-        autowired_annotation_pattern = re.compile(r'/\*\s*@Autowired\s*\*/')
-        autowired_processed_pattern = re.compile(r'/\*--\s*@Autowired\s*--\*/')
-            
-        for line_num, line in enumerate(lines, 1):
-            stripped_line = line.strip()
+        for line_num, stripped_line in enumerate(stripped, 1):
+            # Skip empty lines and single-line comments
+            if not stripped_line or stripped_line.startswith('//'):
+                continue
             
-            # Skip empty lines
-            if not stripped_line:
+            # Cheap substring check before any regex: most lines have no annotation at all
+            if '@Autowired' not in stripped_line and 'AUTOWIRED' not in stripped_line:
                 continue
             
-            # Skip already processed annotations
-            if autowired_processed_pattern.search(stripped_line):
+            # One search tells processed annotation, annotation and legacy macro apart
+            match = _CLASSIFY_RE.search(stripped_line)
+            if match is None:
                 continue
-                
-            # Skip other comments that aren't @Autowired annotations
-            # But allow /* @Autowired */ annotations to be processed
-            if stripped_line.startswith('/*') and not autowired_annotation_pattern.search(stripped_line):
+            kind = match.lastgroup
+            if kind == 'proc':
                 continue
-            # Skip single-line comments
-            if stripped_line.startswith('//'):
+            # A processed annotation later on the line still marks it as processed
+            if kind == 'ann' and _AUTOWIRED_PROC_RE.search(stripped_line, match.end()):
                 continue
-                
-            # Find @Autowired annotation
-            autowired_match = autowired_annotation_pattern.search(stripped_line)
-            if autowired_match:
-                # Look for constructor in the next few lines
-                constructor_info = find_constructor_after_autowired(lines, line_num, class_name)
-                if constructor_info:
-                    # Return the @Autowired annotation line number, not the constructor line number
-                    return {
-                        'type': 'constructor',
-                        'line_number': line_num,  # This is the @Autowired annotation line
-                        'line_content': line.rstrip(),
-                        'constructor_info': constructor_info
-                    }
             
-            # Check for legacy AUTOWIRED macro (for backward compatibility)
-            if re.match(r'^\s*AUTOWIRED\s*$', stripped_line):
-                constructor_info = find_constructor_after_autowired(lines, line_num, class_name)
+            # Look at the next line for the variable declaration
+            var_match = None
+            if line_num < len(stripped):
+                var_match = parse_variable_declaration(stripped[line_num])
+            
+            if var_match:
+                autowired_macros.append({
+                    'type': 'variable',
+                    'line_number': line_num,
+                    'line_content': lines[line_num - 1].rstrip(),
+                    'next_line_number': line_num + 1,
+                    'next_line_content': lines[line_num].rstrip(),
+                    'variable_type': var_match['variable_type'],
+                    'object_name': var_match['object_name'],
+                    'variable_base_type': var_match['variable_base_type']
+                })
+            elif ctx.class_name and autowired_constructor is None:
+                # Look for constructor in the next few lines
+                constructor_info = _find_constructor_in(ctx, line_num)
                 if constructor_info:
-                    return {
+                    # Use the @Autowired annotation line number, not the constructor line number
+                    autowired_constructor = {
                         'type': 'constructor',
                         'line_number': line_num,
-                        'line_content': line.rstrip(),
+                        'line_content': lines[line_num - 1].rstrip(),
                         'constructor_info': constructor_info
                     }
                     
     except Exception as e:
-        # print(f"Error reading file {file_path}: {e}")
-        return None
+        # print(f"Error scanning for @Autowired annotations: {e}")
+        return [], None
         
-    return None
+    return autowired_macros, autowired_constructor
+
+
+def find_autowired_macros(lines):
+    """
+    Find all @Autowired variable annotations in the file that are not processed.
+    
+    Args:
+        lines (list): All lines in the file
+        
+    Returns:
+        list: List of variable macro_info dictionaries
+    """
+    return find_all_autowired(lines)[0]
+
+
+def find_autowired_constructor(lines, class_name):
+    """
+    Find @Autowired constructor for the given class.
+    
+    Args:
+        lines (list): All lines in the file
+        class_name (str): Name of the class to search for
+        
+    Returns:
+        dict: Constructor info or None if not found
+    """
+    return find_all_autowired(lines, class_name)[1]
 
 
-def find_constructor_after_autowired(lines, autowired_line, class_name):
+def find_constructor_after_autowired(lines, autowired_line, class_name, constructor_start_pattern=None):
     """
     Find constructor after @Autowired annotation.
     
@@ -181,48 +240,77 @@ def find_constructor_after_autowired(lines, autowired_line, class_name):
         lines (list): All lines in the file
         autowired_line (int): Line number of @Autowired annotation
         class_name (str): Expected class name for constructor
+        constructor_start_pattern (re.Pattern): Precompiled constructor start pattern for
+            class_name (optional, looked up from the per-class cache if omitted)
+        
+    Returns:
+        dict: Constructor information or None
+    """
+    if constructor_start_pattern is None:
+        constructor_start_pattern = _constructor_start_re(class_name)
+    ctx = FileContext.from_lines('', lines, class_name)
+    ctx.ctor_re = constructor_start_pattern
+    return _find_constructor_in(ctx, autowired_line)
+
+
+def _find_constructor_in(ctx, autowired_line):
+    """
+    Find the constructor of ctx.class_name after an @Autowired annotation.
+    
+    Args:
+        ctx (FileContext): Context of the file, with class_name and ctor_re set
+        autowired_line (int): Line number of @Autowired annotation
         
     Returns:
         dict: Constructor information or None
     """
+    lines = ctx.lines
+    class_name = ctx.class_name
+    constructor_start_pattern = ctx.ctor_re
+    
     # Look in the next 10 lines for constructor start (more restrictive)
     start_line = autowired_line
     end_line = min(autowired_line + 10, len(lines))
     
-    # Updated pattern to handle C++ keywords like 'explicit', 'virtual', 'inline', etc.
-    constructor_start_pattern = rf'^\s*(?:[A-Za-z_][A-Za-z0-9_]*\s+)*{re.escape(class_name)}\s*\('
-    
+    # Pattern handles C++ keywords like 'explicit', 'virtual', 'inline', etc.
     for line_num in range(start_line, end_line):
-        if line_num >= len(lines):
-            break
-            
-        line = lines[line_num].strip()
+        line = ctx.stripped[line_num]
         if not line:
             continue
             
         # Check if this is the start of the constructor
-        if re.match(constructor_start_pattern, line):
+        if constructor_start_pattern.match(line):
             # Found constructor start, now collect all lines until it's complete
             constructor_lines = []
             current_line_num = line_num
             paren_count = 0
             constructor_complete = False
+            # (index into constructor_lines, column) of the parameter list parentheses
+            open_pos = None
+            close_pos = None
             
             while current_line_num < len(lines) and not constructor_complete:
                 current_line = lines[current_line_num]
                 constructor_lines.append(current_line)
                 
+                if close_pos is None:
+                    line_idx = len(constructor_lines) - 1
+                    search_from = 0
+                    if open_pos is None:
+                        open_col = current_line.find('(')
+                        if open_col != -1:
+                            open_pos = (line_idx, open_col)
+                            search_from = open_col + 1
+                    if open_pos is not None:
+                        close_col = current_line.find(')', search_from)
+                        if close_col != -1:
+                            close_pos = (line_idx, close_col)
+                
                 # Count parentheses to find when constructor ends
-                for char in current_line:
-                    if char == '(':
-                        paren_count += 1
-                    elif char == ')':
-                        paren_count -= 1
-                        if paren_count == 0:
-                            # Found closing parenthesis, check if constructor is complete
-                            if '{' in current_line or ':' in current_line:
-                                constructor_complete = True
-                            break
+                paren_count += current_line.count('(') - current_line.count(')')
+                if paren_count == 0 and ('{' in current_line or ':' in current_line):
+                    # Parameter list closed and body/initializer list started
+                    constructor_complete = True
                 
                 current_line_num += 1
                 
@@ -230,10 +318,9 @@ def find_constructor_after_autowired(lines, autowired_line, class_name):
                 if current_line_num > line_num + 15:
                     break
             
-            if constructor_complete:
-                # Join all lines and parse
+            if constructor_complete and close_pos is not None:
                 full_constructor = ''.join(constructor_lines).strip()
-                params = extract_constructor_parameters(full_constructor, class_name)
+                params = extract_constructor_parameters(constructor_lines, open_pos, close_pos, class_name)
                 
                 # Only return if we found valid parameters (this is a constructor AUTOWIRED)
                 if params:
@@ -248,25 +335,32 @@ def find_constructor_after_autowired(lines, autowired_line, class_name):
     return None
 
 
-def extract_constructor_parameters(full_constructor, class_name):
+def extract_constructor_parameters(lines, open_pos, close_pos, class_name):
     """
-    Extract parameters from a full constructor string (can be multiline).
+    Extract parameters from a constructor's lines (can be multiline).
     
     Args:
-        full_constructor (str): Full constructor string
+        lines (list): Lines of the constructor
+        open_pos (tuple): (line index, column) of the '(' opening the parameter list
+        close_pos (tuple): (line index, column) of the first ')' after it
         class_name (str): Class name
         
     Returns:
         list: List of parameter info dictionaries
     """
-    # Find the parameters section between parentheses
-    pattern = rf'{re.escape(class_name)}\s*\(([^)]*)\)'
-    match = re.search(pattern, full_constructor)
-    
-    if not match:
-        return []
+    # Slice the parameters section between the parentheses
+    open_line, open_col = open_pos
+    close_line, close_col = close_pos
+    if open_line == close_line:
+        params_str = lines[open_line][open_col + 1:close_col]
+    else:
+        params_str = ''.join(
+            [lines[open_line][open_col + 1:]]
+            + lines[open_line + 1:close_line]
+            + [lines[close_line][:close_col]]
+        )
     
-    params_str = match.group(1).strip()
+    params_str = params_str.strip()
     if not params_str:
         return []
     
@@ -275,6 +369,26 @@ def extract_constructor_parameters(full_constructor, class_name):
     return params
 
 
+def _is_identifier(token):
+    """Check if token is a plain ASCII C++ identifier ([A-Za-z_][A-Za-z0-9_]*)."""
+    return token.isascii() and token.isidentifier()
+
+
+@functools.lru_cache(maxsize=8192)
+def _make_param(type_str, name):
+    """
+    Build the (type, name, base_type) triple for a ...Ptr declaration.
+    
+    Args:
+        type_str (str): Pointer type ending in "Ptr" (e.g., "XyzPtr")
+        name (str): Variable or parameter name
+        
+    Returns:
+        tuple: (type_str, name, base_type) where base_type has the "Ptr" suffix removed
+    """
+    return (type_str, name, type_str[:-3])
+
+
 def parse_constructor_parameters(params_str):
     """
     Parse constructor parameters string.
@@ -296,11 +410,10 @@ def parse_constructor_parameters(params_str):
             
         # Pattern to match: TypePtr varName [= default_value]
         # Handle both with and without default values
-        param_match = re.match(r'^\s*([A-Za-z_][A-Za-z0-9_]*Ptr)\s+([A-Za-z_][A-Za-z0-9_]*)\s*(?:=.*)?$', part)
+        param_match = _PARAM_RE.match(part)
         if param_match:
-            param_type = param_match.group(1)  # e.g., "XyzPtr"
-            param_name = param_match.group(2)  # e.g., "obj1"
-            base_type = param_type[:-3]  # Remove "Ptr"
+            # e.g., ("XyzPtr", "obj1", "Xyz")
+            param_type, param_name, base_type = _make_param(param_match.group(1), param_match.group(2))
             
             params.append({
                 'type': param_type,
@@ -320,23 +433,23 @@ def parse_variable_declaration(line):
     Returns:
         dict: Parsed information or None if parsing fails
     """
-    # Pattern to match: [Multiple Modifiers] ClassNamePtr obj;
+    # Expected tokens: [Multiple Modifiers] ClassNamePtr obj;
     # Must end with Ptr and have a variable name
     # Modifiers can be Private, Public, Protected, Static, etc.
-    pattern = r'^\s*(?:[A-Za-z_][A-Za-z0-9_]*\s+)*([A-Za-z_][A-Za-z0-9_]*Ptr)\s+([A-Za-z_][A-Za-z0-9_]*)\s*;\s*$'
+    stripped = line.strip()
+    if not stripped.endswith(';'):
+        return None
     
-    match = re.match(pattern, line)
-    if not match:
+    tokens = stripped[:-1].split()
+    if len(tokens) < 2 or not all(_is_identifier(token) for token in tokens):
         return None
-        
-    variable_type = match.group(1)  # e.g., "ClassNamePtr"
-    object_name = match.group(2)    # e.g., "obj"
     
-    # Extract base type by removing "Ptr" suffix
-    if variable_type.endswith('Ptr'):
-        variable_base_type = variable_type[:-3]  # Remove "Ptr"
-    else:
-        return None  # Must end with Ptr
+    type_str = tokens[-2]
+    if len(type_str) <= 3 or not type_str.endswith('Ptr'):
+        return None
+        
+    # e.g., ("ClassNamePtr", "obj", "ClassName")
+    variable_type, object_name, variable_base_type = _make_param(type_str, tokens[-1])
         
     return {
         'variable_type': variable_type,
@@ -358,10 +471,36 @@ def process_autowired_macros(file_path, dry_run=False):
     """
     # print(f"Processing: {file_path}")
     
+    # Map the file and look for annotations before materializing any Python objects;
+    # most files have none, so they are never copied, decoded or parsed
+    data = b''
+    mtime_ns = 0
+    try:
+        with open(file_path, 'rb') as file:
+            file_stat = os.fstat(file.fileno())
+            mtime_ns = file_stat.st_mtime_ns
+            if file_stat.st_size > 0:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b'@Autowired') != -1 or mm.find(b'AUTOWIRED') != -1:
+                        data = mm[:]
+    except Exception as e:
+        # print(f"Error reading file {file_path}: {e}")
+        pass
+    
+    if not data:
+        return {'success': True, 'autowired_count': 0, 'message': 'No @Autowired annotations found'}
+    
+    try:
+        # StringIO with newline=None splits lines exactly like reading in text mode
+        lines = io.StringIO(data.decode('utf-8'), newline=None).readlines()
+    except Exception as e:
+        # print(f"Error decoding file {file_path}: {e}")
+        lines = []
+    
     # Get class name (optional - only needed for constructor @Autowired)
     class_name = None
     try:
-        class_names = get_class_names_from_file(file_path)
+        class_names = _get_class_names_cached(file_path, mtime_ns, lines)
         if class_names:
             class_name = class_names[0]  # Use the first class name
             # print(f"  Class name: {class_name}")
@@ -372,16 +511,9 @@ def process_autowired_macros(file_path, dry_run=False):
         # print(f"  ℹ️  Could not get class name: {e} (this is OK for simple @Autowired variables)")
         pass
     
-    # Find @Autowired variable annotations (these don't need class names)
-    autowired_macros = find_autowired_macros(file_path)
-    
-    # Find @Autowired constructor (this needs class name)
-    autowired_constructor = None
-    if class_name:
-        autowired_constructor = find_autowired_constructor(file_path, class_name)
-    else:
-        # print("  ℹ️  Skipping constructor @Autowired check (no class name available)")
-        pass
+    # Find @Autowired variables and, when a class name is available, the @Autowired constructor
+    ctx = FileContext.from_lines(file_path, lines, class_name)
+    autowired_macros, autowired_constructor = _find_all_autowired_in(ctx)
     
     total_autowired = len(autowired_macros) + (1 if autowired_constructor else 0)
     
@@ -463,7 +595,11 @@ def process_autowired_macros(file_path, dry_run=False):
                 # print(f"    Would comment: {autowired_constructor['line_content']}")
                 
                 if not dry_run:
-                    all_changes.append(autowired_constructor)
+                    # Keep all_changes ordered by line number (variables are already ascending)
+                    insert_at = len(all_changes)
+                    while insert_at and all_changes[insert_at - 1]['line_number'] > autowired_constructor['line_number']:
+                        insert_at -= 1
+                    all_changes.insert(insert_at, autowired_constructor)
                     processed_count += 1
                     # print(f"    ✅ Would process successfully")
                 else:
@@ -481,7 +617,7 @@ def process_autowired_macros(file_path, dry_run=False):
     # Apply all changes at once if not in dry run
     if not dry_run and all_changes:
         # print(f"  🔧 Applying all {len(all_changes)} changes...")
-        success = apply_all_autowired_changes(file_path, all_changes)
+        success = apply_all_autowired_changes(file_path, lines, all_changes)
         if not success:
             errors.append("Failed to apply changes to file")
             # print(f"  ❌ Failed to apply changes to file")
@@ -583,82 +719,93 @@ def generate_line_by_line_replacement(constructor_info, original_lines):
     # Get the original constructor lines
     constructor_lines = original_lines[start_line:end_line]
     
-    # Simple approach: replace each parameter type+name with type+name+default_value
-    # and preserve the original line structure
-    new_lines = []
+    return _expand_constructor_lines(constructor_lines, constructor_info['parameters'])
+
+
+def _expand_constructor_lines(constructor_lines, parameters):
+    """
+    Add GetInstance() default values to the given constructor parameters, preserving line structure.
     
-    for line in constructor_lines:
-        new_line = line
-        
-        # Replace each parameter in this line
-        for param in constructor_info['parameters']:
-            old_param = f"{param['type']} {param['name']}"
-            new_param = f"{param['type']} {param['name']} = Implementation<{param['base_type']}>::type::GetInstance()"
-            
-            # Only replace if this line contains the parameter
-            if old_param in line:
-                new_line = new_line.replace(old_param, new_param)
+    Args:
+        constructor_lines (list): Lines of the constructor
+        parameters (list): Parameter info dictionaries ('type', 'name', 'base_type')
         
-        new_lines.append(new_line)
+    Returns:
+        list: List of replacement lines
+    """
+    if not parameters:
+        return list(constructor_lines)
+    
+    # Map each "Type name" to "Type name = default_value" and replace them all with one
+    # regex pass per line, preserving the original line structure
+    replacements = {
+        f"{param['type']} {param['name']}":
+            f"{param['type']} {param['name']} = Implementation<{param['base_type']}>::type::GetInstance()"
+        for param in parameters
+    }
+    # Longest first so a parameter never shadows another one it is a prefix of
+    alternatives = sorted(replacements, key=len, reverse=True)
+    param_pattern = re.compile(r'\b(' + '|'.join(re.escape(alt) for alt in alternatives) + r')\b')
     
-    return new_lines
+    return [param_pattern.sub(lambda m: replacements[m.group(1)], line) for line in constructor_lines]
 
 
-def apply_all_autowired_changes(file_path, all_macros):
+def apply_all_autowired_changes(file_path, lines, all_macros):
     """
     Apply all AUTOWIRED changes to the file at once.
     
+    The file is rewritten in place, streaming each line out as it is produced.
+    
     Args:
         file_path (str): Path to the file
-        all_macros (list): List of all macro_info dictionaries
+        lines (list): Current lines of the file (not modified)
+        all_macros (list): List of all macro_info dictionaries, ordered by line number
         
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
+        # Replacement text by 0-based line index; untouched lines are written as-is
+        changed = {}
         
-        # Sort macros by line number in descending order to avoid line number shifting
-        sorted_macros = sorted(all_macros, key=lambda x: x['line_number'], reverse=True)
-        
-        for macro_info in sorted_macros:
+        # Callers build all_macros in ascending line order; apply them bottom-up
+        for macro_info in reversed(all_macros):
             # Mark @Autowired annotation as processed or comment out legacy AUTOWIRED macro
             autowired_line = macro_info['line_number'] - 1  # Convert to 0-based index
-            original_line = lines[autowired_line]
+            original_line = changed.get(autowired_line, lines[autowired_line])
             stripped_original = original_line.strip()
             
-            # Check if it's an annotation or legacy macro
-            autowired_annotation_pattern = re.compile(r'/\*\s*@Autowired\s*\*/')
-            if autowired_annotation_pattern.search(stripped_original):
+            # Check if it's an annotation or legacy macro; the scan only reports
+            # /* @Autowired */ lines or bare AUTOWIRED lines, so a literal test is enough
+            if '@Autowired' in stripped_original:
                 # Mark annotation as processed: /* @Autowired */ → /*--@Autowired--*/
                 indent = len(original_line) - len(original_line.lstrip())
                 indent_str = original_line[:indent]
-                lines[autowired_line] = f"{indent_str}/*--@Autowired--*/\n"
+                changed[autowired_line] = f"{indent_str}/*--@Autowired--*/\n"
             else:
                 # Legacy macro: comment it out
-                lines[autowired_line] = f"// {original_line.rstrip()}\n"
+                changed[autowired_line] = f"// {original_line.rstrip()}\n"
             
             if macro_info['type'] == 'variable':
                 # Replace the variable declaration
                 var_line = macro_info['next_line_number'] - 1  # Convert to 0-based index
-                lines[var_line] = f"{macro_info['replacement_code']}\n"
+                changed[var_line] = f"{macro_info['replacement_code']}\n"
             elif macro_info['type'] == 'constructor':
                 # Replace the constructor line by line to preserve exact structure
-                start_line = macro_info['constructor_info']['start_line'] - 1  # Convert to 0-based index
-                end_line = macro_info['constructor_info']['end_line']  # Already 0-based
+                constructor_info = macro_info['constructor_info']
+                start_line = constructor_info['start_line'] - 1  # Convert to 0-based index
+                end_line = min(constructor_info['end_line'], len(lines))  # Already 0-based
                 
-                # Generate line-by-line replacement
-                replacement_lines = generate_line_by_line_replacement(macro_info['constructor_info'], lines)
+                constructor_lines = [changed.get(i, lines[i]) for i in range(start_line, end_line)]
+                replacement_lines = _expand_constructor_lines(constructor_lines, constructor_info['parameters'])
                 
-                # Replace the lines one by one
-                for i, replacement_line in enumerate(replacement_lines):
-                    if start_line + i < len(lines):
-                        lines[start_line + i] = replacement_line
+                for i, replacement_line in enumerate(replacement_lines, start_line):
+                    changed[i] = replacement_line
         
-        # Write back to file
+        # Write back to file, through any symlink, keeping its metadata
         with open(file_path, 'w', encoding='utf-8') as file:
-            file.writelines(lines)
+            for i, line in enumerate(lines):
+                file.write(changed.get(i, line))
             
         return True
         
@@ -667,10 +814,46 @@ def apply_all_autowired_changes(file_path, all_macros):
         return False
 
 
+def process_multiple_files(file_paths, dry_run=False):
+    """
+    Process @Autowired annotations in multiple files.
+    
+    Args:
+        file_paths (list): Paths to the C++ files
+        dry_run (bool): If True, only show what would be changed
+        
+    Returns:
+        dict: Mapping of file path to its process_autowired_macros result
+    """
+    existing_files = [file_path for file_path in file_paths if Path(file_path).exists()]
+    
+    if len(existing_files) > _PARALLEL_MIN_FILES:
+        # Files are independent: process them in parallel across CPU cores
+        chunksize = max(1, len(existing_files) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor() as executor:
+            processed = dict(zip(existing_files, executor.map(
+                process_autowired_macros, existing_files, [dry_run] * len(existing_files), chunksize=chunksize
+            )))
+    else:
+        processed = {file_path: process_autowired_macros(file_path, dry_run) for file_path in existing_files}
+    
+    # Results in input order, whichever way the files were processed
+    all_results = {}
+    for file_path in file_paths:
+        if file_path in processed:
+            all_results[file_path] = processed[file_path]
+        else:
+            # print(f"❌ File not found: {file_path}")
+            all_results[file_path] = {'success': False, 'errors': ['File not found']}
+    
+    return all_results
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Process @Autowired annotations in C++ files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        fromfile_prefix_chars="@",
         epilog="""
 Examples:
   python process_autowired.py file.h                    # Process file
@@ -694,17 +877,7 @@ Examples:
     args = parser.parse_args()
     
     # Process each file
-    all_results = {}
-    
-    for file_path in args.files:
-        if not Path(file_path).exists():
-            # print(f"❌ File not found: {file_path}")
-            all_results[file_path] = {'success': False, 'errors': ['File not found']}
-            continue
-            
-        result = process_autowired_macros(file_path, args.dry_run)
-        all_results[file_path] = result
-        # print()  # Add spacing between files
+    all_results = process_multiple_files(args.files, args.dry_run)
     
     # Summary
     if len(args.files) > 1:
@@ -727,6 +900,28 @@ Examples:
         # else:
         #     print("✅ Changes applied successfully")
         pass
+    
+    return all_results
+
+
+# Export functions for other scripts to import
+__all__ = [
+    'FileContext',
+    'find_all_autowired',
+    'find_autowired_macros',
+    'find_autowired_constructor',
+    'find_constructor_after_autowired',
+    'extract_constructor_parameters',
+    'parse_constructor_parameters',
+    'parse_variable_declaration',
+    'process_autowired_macros',
+    'apply_autowired_changes',
+    'generate_constructor_replacement',
+    'generate_line_by_line_replacement',
+    'apply_all_autowired_changes',
+    'process_multiple_files',
+    'main'
+]
 
 
 if __name__ == "__main__":
@@ -329,7 +329,8 @@ def validate_cpp_file(file_path: str) -> bool:
 def main():
     """Main function to handle command line arguments and execute the component processing."""
     parser = argparse.ArgumentParser(
-        description="Process component files by running a sequence of scripts when @Component annotation is found"
+        description="Process component files by running a sequence of scripts when @Component annotation is found",
+        fromfile_prefix_chars="@"
     )
     parser.add_argument(
         "files", 
@@ -6,20 +6,67 @@ This script orchestrates the processing of C++ files for dependency injection by
 1. Running L4_process_component.py to process COMPONENT macros
 2. Running L4_process_autowired.py to process AUTOWIRED macros
 
-Both scripts are called with the same include and exclude parameters.
+Both scripts are called with the same include and exclude parameters. They are
+imported and run in this interpreter, falling back to subprocesses if the import fails.
+Setting the environment variable SPRINGBOOTPLUSPLUS_WEB_USE_SUBPROCESS=1 always runs
+them as subprocesses.
 """
 
 import argparse
+import mmap
 import subprocess
 import sys
+import tempfile
 import os
-from pathlib import Path
+import re
 
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Child scripts and the interpreter that runs them, resolved once at import time
+COMPONENT_SCRIPT = os.path.join(SCRIPT_DIR, "L4_process_component.py")
+AUTOWIRED_SCRIPT = os.path.join(SCRIPT_DIR, "L4_process_autowired.py")
+PYTHON = sys.executable or "python"
 
+# Byte forms a stage acts on, matched in a single pass. Only active annotations
+# (/* @Component */, /* @Service */, /* @Autowired */) and legacy macros alone on
+# their line count; processed /*--@...--*/ forms and commented-out macros do not,
+# so files already handled by an earlier build skip both stages. Both forms are
+# loose supersets of what the stages match (any bytes but '-'/'@' after "/*",
+# any whitespace or non-ASCII byte around a legacy macro), so no file that a
+# stage would change is skipped.
+_MARKERS_RE = re.compile(
+    rb'(?P<comp>/\*[^-@\r\n]*@(?:Component|Service)'
+    rb'|(?<![^\r\n])[\t\x0b\x0c \x1c-\x1f\x80-\xff]*COMPONENT[\t\x0b\x0c \x1c-\x1f\x80-\xff]*(?![^\r\n]))'
+    rb'|(?P<auto>/\*[^-@\r\n]*@Autowired'
+    rb'|(?<![^\r\n])[\t\x0b\x0c \x1c-\x1f\x80-\xff]*AUTOWIRED[\t\x0b\x0c \x1c-\x1f\x80-\xff]*(?![^\r\n]))'
+)
 
+# File lists longer than this are passed to child scripts through an @listfile
+ARGFILE_MIN_FILES = 256
+ARGFILE_MIN_CHARS = 65536
+
+# Command-line shape of each L4 script run_script can launch
+SCRIPT_SPECS = {
+    "L4_process_component.py": {"path": COMPONENT_SCRIPT, "supports_include": True},
+    "L4_process_autowired.py": {"path": AUTOWIRED_SCRIPT, "supports_include": False},
+}
+
+# Make the sibling L4 scripts importable when this file is run directly
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+# Run the L4 stages in this interpreter when they can be imported;
+# run_script (one subprocess per stage) remains as the fallback, and
+# setting SPRINGBOOTPLUSPLUS_WEB_USE_SUBPROCESS=1 forces it, e.g. to isolate the stages' side effects
+USE_SUBPROCESS = os.environ.get("SPRINGBOOTPLUSPLUS_WEB_USE_SUBPROCESS", "") not in ("", "0")
+try:
+    import L4_process_component
+    import L4_process_autowired
+except (ImportError, SystemExit):
+    # L4_process_autowired exits if its own imports fail
+    L4_process_component = None
+    L4_process_autowired = None
 
 
 def run_script(script_name, files, include_paths, exclude_paths, dry_run=False):
@@ -43,15 +90,24 @@ def run_script(script_name, files, include_paths, exclude_paths, dry_run=False):
         
         # print(f"📁 Processing {len(files)} file(s) with {script_name}")
         
-        # Build the command based on script requirements
-        if script_name == "L4_process_component.py":
-            # L4_process_component.py expects: files [--include paths] [--exclude paths] [--dry-run]
-            script_path = os.path.join(SCRIPT_DIR, script_name)
-            cmd = ["python", script_path]
-            
-            # Add the specific files to process FIRST (positional arguments)
-            cmd.extend(files)
-            
+        spec = SCRIPT_SPECS.get(script_name)
+        if spec is None:
+            # print(f"❌ Unknown script: {script_name}")
+            return False
+        
+        # Build the command: files [--include paths] [--exclude paths] [--dry-run]
+        # Add the specific files to process FIRST (positional arguments); long lists
+        # go through an @listfile so the command line stays small
+        list_file = None
+        if len(files) > ARGFILE_MIN_FILES or sum(map(len, files)) > ARGFILE_MIN_CHARS:
+            with tempfile.NamedTemporaryFile('w', suffix='.lst', delete=False, encoding='utf-8') as tmp:
+                tmp.write('\n'.join(files) + '\n')
+            list_file = tmp.name
+            cmd = [PYTHON, spec["path"], f"@{list_file}"]
+        else:
+            cmd = [PYTHON, spec["path"], *files]
+        
+        if spec["supports_include"]:
             # Add include paths if provided
             if include_paths:
                 cmd.extend(["--include"] + include_paths)
@@ -59,39 +115,22 @@ def run_script(script_name, files, include_paths, exclude_paths, dry_run=False):
             # Add exclude paths if provided
             if exclude_paths:
                 cmd.extend(["--exclude"] + exclude_paths)
-            
-            # Add dry-run flag if specified
-            if dry_run:
-                cmd.append("--dry-run")
-            
-        elif script_name == "L4_process_autowired.py":
-            # L4_process_autowired.py expects: files [--dry-run]
-            script_path = os.path.join(SCRIPT_DIR, script_name)
-            cmd = ["python", script_path]
-            
-            # Add the specific files to process FIRST (positional arguments)
-            cmd.extend(files)
-            
-            # Add dry-run flag if specified
-            if dry_run:
-                cmd.append("--dry-run")
-            
-        else:
-            # print(f"❌ Unknown script: {script_name}")
-            return False
         
-        # print(f"Running: {' '.join(cmd)}")
+        # Add dry-run flag if specified
+        if dry_run:
+            cmd.append("--dry-run")
         
-        # Run the script
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=".")
+        # print(f"Running: {' '.join(cmd)}")
         
-        # Print output
-        if result.stdout:
-            # print(result.stdout)
-            pass
-        if result.stderr:
-            # print(f"Errors from {script_name}:", result.stderr, file=sys.stderr)
-            pass
+        # Run the script; its output is never used, so discard it instead of buffering it.
+        # An absolute interpreter path, close_fds=False and no cwd let subprocess
+        # launch the child with posix_spawn instead of fork+exec (fds are non-inheritable
+        # by default, and cwd="." was the current directory anyway).
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False)
+        finally:
+            if list_file:
+                os.unlink(list_file)
         
         if result.returncode == 0:
             # print(f"✅ {script_name} completed successfully")
@@ -105,6 +144,115 @@ def run_script(script_name, files, include_paths, exclude_paths, dry_run=False):
         return False
 
 
+def run_script_in_process(script_name, files, include_paths, exclude_paths, dry_run=False):
+    """
+    Run an L4 script's processing through its imported module instead of a subprocess.
+    
+    Mirrors what the script's main() does for the same command line, without paying
+    for a new interpreter and the argument parsing.
+    
+    Args:
+        script_name (str): Name of the script to run
+        files (list): List of specific files to process
+        include_paths (list): List of include paths
+        exclude_paths (list): List of exclude paths
+        dry_run (bool): Whether to run in dry-run mode
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        if not files:
+            # print(f"⚠️  No files specified for {script_name}")
+            return False
+        
+        if script_name == "L4_process_component.py":
+            valid_files = [f for f in files if L4_process_component.validate_cpp_file(f)]
+            if valid_files:
+                L4_process_component.process_multiple_files(valid_files, include_paths, exclude_paths, dry_run)
+        elif script_name == "L4_process_autowired.py":
+            L4_process_autowired.process_multiple_files(files, dry_run)
+        else:
+            # print(f"❌ Unknown script: {script_name}")
+            return False
+        
+        # print(f"✅ {script_name} completed successfully")
+        return True
+        
+    except Exception as e:
+        # print(f"❌ Error running {script_name}: {e}")
+        return False
+
+
+def run_stage(script_name, files, include_paths, exclude_paths, dry_run=False):
+    """
+    Run an L4 script in process when its module is available, otherwise as a subprocess.
+    
+    Args:
+        script_name (str): Name of the script to run
+        files (list): List of specific files to process
+        include_paths (list): List of include paths
+        exclude_paths (list): List of exclude paths
+        dry_run (bool): Whether to run in dry-run mode
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if not USE_SUBPROCESS and L4_process_component is not None and L4_process_autowired is not None:
+        return run_script_in_process(script_name, files, include_paths, exclude_paths, dry_run)
+    return run_script(script_name, files, include_paths, exclude_paths, dry_run)
+
+
+def _unique_paths(paths):
+    """
+    Normalize include/exclude paths and drop duplicates, keeping their order.
+    
+    Args:
+        paths (list): Include or exclude paths as given on the command line
+        
+    Returns:
+        list: Paths with duplicates (after os.path.normpath) removed
+    """
+    seen = set()
+    unique = []
+    for path in paths:
+        normalized = os.path.normpath(path)
+        if normalized not in seen:
+            seen.add(normalized)
+            unique.append(normalized)
+    return unique
+
+
+def _scan_markers(file_path):
+    """
+    Check which DI stages a file needs, with one memory-mapped read of the file.
+    
+    Args:
+        file_path (str): Path to the C++ file
+        
+    Returns:
+        tuple: (needs_component, needs_autowired); both True if the file cannot be read,
+            so the stages handle and report it as before
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return False, False
+            needs_component = False
+            needs_autowired = False
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in _MARKERS_RE.finditer(mm):
+                    if match.lastgroup == 'comp':
+                        needs_component = True
+                    else:
+                        needs_autowired = True
+                    if needs_component and needs_autowired:
+                        break
+            return needs_component, needs_autowired
+    except (OSError, ValueError):
+        return True, True
+
+
 def process_di(files, include_paths, exclude_paths, dry_run=False):
     """
     Process dependency injection by running both component and autowired scripts.
@@ -129,11 +277,34 @@ def process_di(files, include_paths, exclude_paths, dry_run=False):
         'errors': []
     }
     
+    # Every header lookup in the COMPONENT stage walks each include path, so
+    # repeated paths (e.g. "src" and "./src") are resolved away once here
+    include_paths = _unique_paths(include_paths)
+    exclude_paths = _unique_paths(exclude_paths)
+    
+    # Read each file once to see which stages have anything to do in it; a stage
+    # leaves files without its markers untouched
+    component_files = []
+    autowired_files = []
+    for file_path in files:
+        needs_component, needs_autowired = _scan_markers(file_path)
+        if needs_component:
+            component_files.append(file_path)
+        if needs_autowired:
+            autowired_files.append(file_path)
+    
+    # The two stages must run one after the other, not concurrently: both rewrite
+    # the target files in place, and the COMPONENT stage also edits other files
+    # (the reverse include goes into the interface header), so overlapping them
+    # could lose one stage's edits.
+    
     # Step 1: Process COMPONENT macros
     # print("\n📋 Step 1: Processing COMPONENT macros with L4_process_component.py")
     # print("-" * 60)
     
-    component_success = run_script("L4_process_component.py", files, include_paths, exclude_paths, dry_run)
+    component_success = True
+    if component_files:
+        component_success = run_stage("L4_process_component.py", component_files, include_paths, exclude_paths, dry_run)
     results['component_success'] = component_success
     
     if not component_success:
@@ -143,7 +314,9 @@ def process_di(files, include_paths, exclude_paths, dry_run=False):
     # print("\n🔧 Step 2: Processing AUTOWIRED macros with L4_process_autowired.py")
     # print("-" * 60)
     
-    autowired_success = run_script("L4_process_autowired.py", files, include_paths, exclude_paths, dry_run)
+    autowired_success = True
+    if autowired_files:
+        autowired_success = run_stage("L4_process_autowired.py", autowired_files, include_paths, exclude_paths, dry_run)
     results['autowired_success'] = autowired_success
     
     if not autowired_success:
@@ -180,6 +353,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="L5 Process DI - Orchestrate COMPONENT and AUTOWIRED processing for specific files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        fromfile_prefix_chars="@",
         epilog="""
 Examples:
   python springbootplusplus_web_core/L5_process_di.py file.h                                    # Process single file
@@ -188,13 +362,14 @@ Examples:
   python springbootplusplus_web_core/L5_process_di.py file.h --include src --exclude platform/arduino  # Process with include/exclude
   python springbootplusplus_web_core/L5_process_di.py file.h --include src platform --dry-run    # Dry run to see what would happen
   python springbootplusplus_web_core/L5_process_di.py file.h --dry-run                          # Dry run on specific file
+  python springbootplusplus_web_core/L5_process_di.py @files.txt --include src                  # Process files listed one per line in files.txt
         """
     )
     
     parser.add_argument(
         "files",
         nargs="+",
-        help="C++ header files to process (required)"
+        help="C++ header files to process (required); @listfile reads arguments from listfile, one per line"
     )
     
     parser.add_argument(
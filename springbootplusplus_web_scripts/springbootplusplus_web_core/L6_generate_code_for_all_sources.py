@@ -15,8 +15,9 @@ import argparse
 import sys
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 # Add springbootplusplus_web_core directory to path for imports (current directory)
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -32,6 +33,101 @@ except ImportError as e:
     sys.exit(1)
 
 
+# REST mapping annotation names, in the order they take precedence when a line holds several
+_REST_MAPPING_NAMES = ('RequestMapping', 'GetMapping', 'PostMapping', 'PutMapping', 'DeleteMapping', 'PatchMapping')
+
+# Single pattern for every REST annotation: /* @RestController */, /* @GetMapping("...") */, etc.
+# The optional "done" group matches the processed form (/*--@...--*/); "path" holds the mapping path.
+_REST_ANNOTATION_RE = re.compile(
+    r'/\*(?P<done>--)?\s*@(?:(?P<controller>RestController)'
+    r'|(?P<name>' + '|'.join(_REST_MAPPING_NAMES) + r')\s*\(\s*["\'](?P<path>[^"\']+)["\']\s*\))'
+    r'\s*(?(done)--)\*/'
+)
+
+# Legacy REST-related macros on their own line (for backward compatibility, will be commented out)
+_LEGACY_REST_MACRO_RE = re.compile(
+    r'^(?:RestController|RequestMapping|GetMapping|PostMapping|PutMapping|DeleteMapping|PatchMapping)'
+    r'(?:\s*\([^)]*\))?\s*$'
+)
+
+# Byte marker every REST controller source contains (annotation and legacy macro alike)
+_REST_CONTROLLER_MARKER = b'RestController'
+
+# #include lines of EventDispatcher.h; controller includes (any path mentioning "controller") are replaced on each run
+_INCLUDE_LINE_RE = re.compile(r'^[^\S\n]*#include[^\n]*', re.MULTILINE)
+_CONTROLLER_INCLUDE_LINE_RE = re.compile(r'^[^\S\n]*#include(?i:[^\n]*controller)[^\n]*(?:\n|\Z)', re.MULTILINE)
+
+# Whitespace-only lines and starts of non-empty lines, for indenting the InitializeMappings() body
+_BLANK_LINE_RE = re.compile(r'^[^\S\n]+$', re.MULTILINE)
+_LINE_START_RE = re.compile(r'^(?=[^\n])', re.MULTILINE)
+
+# Lines that may need rewriting: a block comment followed by '@', or a line starting with a legacy macro name.
+# Every other line is left to the regex engine and never reaches Python code.
+_REST_CANDIDATE_LINE_RE = re.compile(
+    r'^(?:[^\n]*/\*[^\n]*@'
+    r'|[^\S\n]*(?:RestController|RequestMapping|GetMapping|PostMapping|PutMapping|DeleteMapping|PatchMapping))'
+    r'[^\n]*$',
+    re.MULTILINE
+)
+
+
+# C++ source file extensions picked up by find_cpp_files
+_CPP_EXTENSIONS = ('.h', '.hpp', '.cpp', '.cc', '.cxx')
+
+
+def _is_excluded(path: str, exclude_roots: List[str]) -> bool:
+    """
+    Check whether a resolved path is one of the exclude roots or lies below one.
+    
+    Args:
+        path: Resolved absolute path
+        exclude_roots: Resolved absolute exclude paths
+        
+    Returns:
+        True if the path is excluded, False otherwise
+    """
+    for exclude_root in exclude_roots:
+        if path == exclude_root or path.startswith(exclude_root.rstrip(os.sep) + os.sep):
+            return True
+    return False
+
+
+def _walk_cpp_files(directory: str, exclude_roots: List[str], exclude_set: FrozenSet[str], cpp_files: List[str]) -> None:
+    """
+    Recursively collect C++ source files below a directory using os.scandir.
+    Symlinked directories are not descended into; symlinked files are resolved to their target.
+    Excluded subdirectories are pruned instead of testing every file below them.
+    
+    Args:
+        directory: Resolved absolute directory to walk (must not be excluded)
+        exclude_roots: Resolved absolute exclude paths
+        exclude_set: The same exclude paths as a set, for exact hits
+        cpp_files: List the resolved file paths are appended to
+    """
+    try:
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+    except OSError:
+        return
+    
+    for entry in entries:
+        if entry.name.endswith(_CPP_EXTENSIONS):
+            if entry.is_symlink():
+                # The target may live anywhere, so check it against every exclude root
+                file_path_str = os.path.realpath(entry.path)
+                if not _is_excluded(file_path_str, exclude_roots):
+                    cpp_files.append(file_path_str)
+            elif entry.path not in exclude_set:
+                cpp_files.append(entry.path)
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        # Parent directories are already known not to be excluded, so an exact hit is enough
+        if is_dir and entry.path not in exclude_set:
+            _walk_cpp_files(entry.path, exclude_roots, exclude_set, cpp_files)
+
+
 def find_cpp_files(include_paths: List[str], exclude_paths: List[str]) -> List[str]:
     """
     Find all C++ source files in the specified include/exclude paths.
@@ -50,34 +146,72 @@ def find_cpp_files(include_paths: List[str], exclude_paths: List[str]) -> List[s
     if not include_paths:
         include_paths = ["."]
     
+    # Resolve exclude paths once instead of per file
+    exclude_roots = [os.path.realpath(exclude_path) for exclude_path in exclude_paths]
+    exclude_set = frozenset(exclude_roots)
+    
     for include_path in include_paths:
-        include_path_obj = Path(include_path).resolve()
-        if not include_path_obj.exists():
+        include_root = os.path.realpath(include_path)
+        if not os.path.exists(include_root):
             # print(f"⚠️  Warning: Include path '{include_path}' does not exist")
             continue
+        if _is_excluded(include_root, exclude_roots):
+            continue
             
-        # Find all C++ source files (.h, .hpp, .cpp, .cc, .cxx)
-        for ext in ["*.h", "*.hpp", "*.cpp", "*.cc", "*.cxx"]:
-            for file_path in include_path_obj.rglob(ext):
-                file_path_str = str(file_path.resolve())
-                # Check if file should be excluded
-                should_exclude = False
-                for exclude_path in exclude_paths:
-                    exclude_path_obj = Path(exclude_path).resolve()
-                    try:
-                        if file_path.resolve().is_relative_to(exclude_path_obj):
-                            should_exclude = True
-                            break
-                    except ValueError:
-                        # Path is not relative to exclude_path, continue checking
-                        pass
-                
-                if not should_exclude:
-                    cpp_files.append(file_path_str)
+        # Find all C++ source files (.h, .hpp, .cpp, .cc, .cxx) in a single walk
+        _walk_cpp_files(include_root, exclude_roots, exclude_set, cpp_files)
     
     return sorted(cpp_files)
 
 
+def _rewrite_rest_line(line: str) -> Optional[str]:
+    """
+    Rewrite a single line holding a REST annotation or legacy REST macro.
+    
+    Args:
+        line: Source line without its trailing newline
+        
+    Returns:
+        The rewritten line, or None if the line is left unchanged
+    """
+    stripped_line = line.strip()
+    
+    # Collect the REST annotations on this line (first occurrence of each kind)
+    found = {}
+    for annotation_match in _REST_ANNOTATION_RE.finditer(stripped_line):
+        annotation_name = annotation_match.group('controller') or annotation_match.group('name')
+        found.setdefault((annotation_name, annotation_match.group('done') is not None), annotation_match)
+    
+    if found:
+        # @RestController wins over mappings; for each annotation an already processed form wins
+        for annotation_name in ('RestController',) + _REST_MAPPING_NAMES:
+            if (annotation_name, True) in found:
+                return None
+            if (annotation_name, False) in found:
+                annotation_match = found[(annotation_name, False)]
+                break
+        else:
+            return None
+        
+        indent = len(line) - len(line.lstrip())
+        indent_str = line[:indent]
+        if annotation_name == 'RestController':
+            # Replace /* @RestController */ with /* @Component */
+            return f"{indent_str}/* @Component */"
+        # Replace /* @GetMapping("...") */ with /*--@GetMapping("...")--*/
+        path_value = annotation_match.group('path')
+        return f"{indent_str}/*--@{annotation_name}(\"{path_value}\")--*/"
+    
+    # Skip single-line comments (other /* ... */ comments can never match a legacy macro below)
+    if stripped_line.startswith('//'):
+        return None
+    
+    # Check if line is a legacy REST macro (for backward compatibility)
+    if _LEGACY_REST_MACRO_RE.match(stripped_line):
+        return '// ' + line
+    return None
+
+
 def comment_rest_macros(file_path: str, dry_run: bool = False) -> bool:
     """
     Mark all REST-related annotations as processed (/* @RestController */, /* @RequestMapping("...") */, etc.) in a C++ file.
@@ -93,112 +227,24 @@ def comment_rest_macros(file_path: str, dry_run: bool = False) -> bool:
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-        
-        # Patterns for @RestController annotation (search for /* @RestController */ or /*@RestController*/)
-        rest_controller_annotation_pattern = re.compile(r'/\*\s*@RestController\s*\*/')
-        rest_controller_processed_pattern = re.compile(r'/\*--\s*@RestController\s*--\*/')
-        # Pattern to check if @Component already exists (to avoid duplicate)
-        component_annotation_pattern = re.compile(r'/\*\s*@Component\s*\*/')
-        component_processed_pattern = re.compile(r'/\*--\s*@Component\s*--\*/')
-        
-        # Patterns for REST mapping annotations (search for /* @Annotation("...") */ or /*@Annotation("...")*/)
-        rest_mapping_annotations = {
-            'RequestMapping': (re.compile(r'/\*\s*@RequestMapping\s*\(\s*["\']([^"\']+)["\']\s*\)\s*\*/'), re.compile(r'/\*--\s*@RequestMapping\s*\(\s*["\'][^"\']+["\']\s*\)\s*--\*/')),
-            'GetMapping': (re.compile(r'/\*\s*@GetMapping\s*\(\s*["\']([^"\']+)["\']\s*\)\s*\*/'), re.compile(r'/\*--\s*@GetMapping\s*\(\s*["\'][^"\']+["\']\s*\)\s*--\*/')),
-            'PostMapping': (re.compile(r'/\*\s*@PostMapping\s*\(\s*["\']([^"\']+)["\']\s*\)\s*\*/'), re.compile(r'/\*--\s*@PostMapping\s*\(\s*["\'][^"\']+["\']\s*\)\s*--\*/')),
-            'PutMapping': (re.compile(r'/\*\s*@PutMapping\s*\(\s*["\']([^"\']+)["\']\s*\)\s*\*/'), re.compile(r'/\*--\s*@PutMapping\s*\(\s*["\'][^"\']+["\']\s*\)\s*--\*/')),
-            'DeleteMapping': (re.compile(r'/\*\s*@DeleteMapping\s*\(\s*["\']([^"\']+)["\']\s*\)\s*\*/'), re.compile(r'/\*--\s*@DeleteMapping\s*\(\s*["\'][^"\']+["\']\s*\)\s*--\*/')),
-            'PatchMapping': (re.compile(r'/\*\s*@PatchMapping\s*\(\s*["\']([^"\']+)["\']\s*\)\s*\*/'), re.compile(r'/\*--\s*@PatchMapping\s*\(\s*["\'][^"\']+["\']\s*\)\s*--\*/'))
-        }
+            content = file.read()
         
-        # Legacy REST-related macros (for backward compatibility, will be commented out)
-        rest_macros = [
-            'RestController', 'RequestMapping', 'GetMapping', 'PostMapping',
-            'PutMapping', 'DeleteMapping', 'PatchMapping'
-        ]
+        def replace_line(match):
+            line = match.group(0)
+            processed_line = _rewrite_rest_line(line)
+            if processed_line is None:
+                return line
+            # Annotation rewrites always end with a newline, even on an unterminated last line
+            if match.end() == len(content) and not processed_line.startswith('// '):
+                processed_line += '\n'
+            return processed_line
         
-        modified = False
-        modified_lines = []
-        
-        for i, line in enumerate(lines):
-            original_line = line
-            stripped_line = line.strip()
-            
-            # Process @RestController annotation - replace with @Component
-            if rest_controller_processed_pattern.search(stripped_line):
-                modified_lines.append(line)
-                continue
-            
-            rest_controller_match = rest_controller_annotation_pattern.search(stripped_line)
-            if rest_controller_match:
-                indent = len(line) - len(line.lstrip())
-                indent_str = line[:indent]
-                # Replace /* @RestController */ with /* @Component */
-                processed_line = f"{indent_str}/* @Component */\n"
-                if not dry_run:
-                    modified_lines.append(processed_line)
-                else:
-                    modified_lines.append(line)
-                modified = True
-                continue
-            
-            # Process other REST mapping annotations
-            annotation_processed = False
-            for annotation_name, (annotation_pattern, processed_pattern) in rest_mapping_annotations.items():
-                if processed_pattern.search(stripped_line):
-                    modified_lines.append(line)
-                    annotation_processed = True
-                    break
-                
-                annotation_match = annotation_pattern.search(stripped_line)
-                if annotation_match:
-                    indent = len(line) - len(line.lstrip())
-                    indent_str = line[:indent]
-                    # Extract the annotation name and path value
-                    annotation_name = annotation_name  # e.g., "GetMapping"
-                    path_value = annotation_match.group(1)  # Extract path from group 1
-                    processed_line = f"{indent_str}/*--@{annotation_name}(\"{path_value}\")--*/\n"
-                    if not dry_run:
-                        modified_lines.append(processed_line)
-                    else:
-                        modified_lines.append(line)
-                    modified = True
-                    annotation_processed = True
-                    break
-            
-            if annotation_processed:
-                continue
-            
-            # Skip other comments that aren't REST annotations
-            # But allow /* @RestController */, /* @RequestMapping("...") */, etc. to be processed
-            if stripped_line.startswith('/*') and not (rest_controller_annotation_pattern.search(stripped_line) or any(ann[0].search(stripped_line) for ann in rest_mapping_annotations.values())):
-                modified_lines.append(line)
-                continue
-            # Skip single-line comments
-            if stripped_line.startswith('//'):
-                modified_lines.append(line)
-                continue
-            
-            # Check if line starts with any legacy REST macro (for backward compatibility)
-            line_modified = False
-            for macro in rest_macros:
-                pattern = re.compile(r'^' + re.escape(macro) + r'(?:\s*\([^)]*\))?\s*$')
-                if pattern.match(stripped_line):
-                    if not dry_run:
-                        modified_lines.append('// ' + line)
-                    else:
-                        modified_lines.append(line)
-                    modified = True
-                    line_modified = True
-                    break
-            
-            if not line_modified:
-                modified_lines.append(line)
+        new_content = _REST_CANDIDATE_LINE_RE.sub(replace_line, content)
+        modified = new_content != content
         
         if modified and not dry_run:
             with open(file_path, 'w', encoding='utf-8') as file:
-                file.writelines(modified_lines)
+                file.write(new_content)
             # print(f"✓ Processed REST annotations/macros in: {file_path}")
         elif modified and dry_run:
             # print(f"  Would process REST annotations/macros in: {file_path}")
@@ -216,6 +262,60 @@ def comment_rest_macros(file_path: str, dry_run: bool = False) -> bool:
         return False
 
 
+def _has_rest_controller_marker(file_path: str) -> bool:
+    """
+    Cheap pre-check on the raw bytes: both the /* @RestController */ annotation and the legacy
+    RestController macro contain "RestController", so files without it cannot yield endpoint code.
+    
+    Args:
+        file_path: Path to the C++ file
+        
+    Returns:
+        True if the file may hold a REST controller (or could not be read), False otherwise
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            return _REST_CONTROLLER_MARKER in file.read()
+    except OSError:
+        # Let the generator report on unreadable files as before
+        return True
+
+
+def _generate_code_for_source(file_path: str, dry_run: bool = False) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Generate code for a single source file and mark its REST annotations as processed.
+    Runs in a worker process when generate_code_map() processes several files.
+    
+    Args:
+        file_path: Path to the C++ file to process
+        dry_run: If True, don't actually comment macros
+        
+    Returns:
+        Tuple of (generated code, interface name), or None if the file has no valid generated code
+    """
+    # Generate code for this file
+    generated_code = L5_generate_code_for_file.generate_code_for_file(file_path)
+    
+    # Only keep files whose code is valid (not empty, not None)
+    if not generated_code or not generated_code.strip():
+        return None
+    
+    # Get interface name from the file
+    class_info = L3_get_endpoint_details.find_class_and_interface(file_path)
+    interface_name = class_info['interface_name'] if class_info else None
+    
+    # Mark REST-related annotations as processed in this file (each file is only touched by its own task)
+    if not dry_run:
+        # print(f"  Processing REST annotations in: {file_path}")
+        pass
+    else:
+        # print(f"  Would process REST annotations in: {file_path}")
+        pass
+    comment_rest_macros(file_path, dry_run=dry_run)
+    
+    return generated_code, interface_name
+
+
 def generate_code_map(cpp_files: List[str], dry_run: bool = False) -> Dict[str, Dict[str, str]]:
     """
     Generate code for all source files and store valid results in a map.
@@ -234,32 +334,30 @@ def generate_code_map(cpp_files: List[str], dry_run: bool = False) -> Dict[str,
     processed_count = 0
     skipped_count = 0
     
-    for file_path in cpp_files:
-        # Generate code for this file
-        generated_code = L5_generate_code_for_file.generate_code_for_file(file_path)
-        
-        # Only add to map if code is valid (not empty, not None)
-        if generated_code and generated_code.strip():
-            # Get interface name from the file
-            class_info = L3_get_endpoint_details.find_class_and_interface(file_path)
-            interface_name = class_info['interface_name'] if class_info else None
-            
-            code_map[file_path] = {
-                'code': generated_code,
-                'interface_name': interface_name
-            }
-            processed_count += 1
-            
-            # Mark REST-related annotations as processed in this file
-            if not dry_run:
-                # print(f"  Processing REST annotations in: {file_path}")
-                pass
-            else:
-                # print(f"  Would process REST annotations in: {file_path}")
-                pass
-            comment_rest_macros(file_path, dry_run=dry_run)
-        else:
+    # Most sources hold no REST controller; drop them before any parsing or worker dispatch
+    candidate_files = [file_path for file_path in cpp_files if _has_rest_controller_marker(file_path)]
+    skipped_count += len(cpp_files) - len(candidate_files)
+    cpp_files = candidate_files
+    
+    if len(cpp_files) > 1:
+        # Files are independent: process them in parallel across CPU cores, keeping the input order
+        chunksize = max(1, len(cpp_files) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_generate_code_for_source, cpp_files, [dry_run] * len(cpp_files), chunksize=chunksize))
+    else:
+        results = [_generate_code_for_source(file_path, dry_run) for file_path in cpp_files]
+    
+    for file_path, result in zip(cpp_files, results):
+        if result is None:
             skipped_count += 1
+            continue
+        
+        generated_code, interface_name = result
+        code_map[file_path] = {
+            'code': generated_code,
+            'interface_name': interface_name
+        }
+        processed_count += 1
     
     # print(f"✅ Processed {processed_count} file(s) with RestController")
     # print(f"⏭️  Skipped {skipped_count} file(s) without RestController")
@@ -272,7 +370,7 @@ def generate_includes(code_map: Dict[str, Dict[str, str]], project_root: Optiona
     Generate #include statements for interface headers of all files in the code map.
     
     Args:
-        code_map: Dictionary mapping file paths to dictionaries with 'code' and 'interface_name'
+        code_map: Dictionary mapping resolved file paths (as returned by find_cpp_files) to dictionaries with 'code' and 'interface_name'
         project_root: Project root directory (if None, will try to find it)
         include_paths: List of include paths to search for interface headers
         exclude_paths: List of exclude paths to avoid when searching
@@ -288,42 +386,41 @@ def generate_includes(code_map: Dict[str, Dict[str, str]], project_root: Optiona
         script_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.dirname(os.path.dirname(script_dir))  # Go up from springbootplusplus_web_core/springbootplusplus_web_scripts/ to project root
     
-    project_root_path = Path(project_root).resolve()
-    
     # Default include/exclude paths if not provided
     if include_paths is None:
         include_paths = ["src"]
     if exclude_paths is None:
         exclude_paths = []
     
+    # Files searched for interface headers, collected once on first use instead of once per interface
+    header_search_files = None
+    
     for file_path in sorted(code_map.keys()):
         file_info = code_map[file_path]
         interface_name = file_info.get('interface_name')
         
         if not interface_name:
             # Fallback: use implementation header if interface name not found
-            file_path_obj = Path(file_path).resolve()
-            include_path = str(file_path_obj).replace('\\', '/')  # Use absolute path
+            include_path = file_path.replace('\\', '/')  # Already an absolute, resolved path
             includes.append(f'#include "{include_path}"')
             continue
         
         # Find interface header file
-        interface_header = L1_find_class_header.find_class_header_file(
-            class_name=interface_name,
-            search_root=project_root,
-            include_folders=include_paths,
-            exclude_folders=exclude_paths
-        )
+        if header_search_files is None:
+            header_search_files = L1_find_class_header.collect_cpp_files(
+                search_root=project_root,
+                include_folders=include_paths,
+                exclude_folders=exclude_paths
+            )
+        interface_header = L1_find_class_header.find_class_header_in_files(interface_name, header_search_files)
         
         if interface_header:
-            # Use absolute path for the include
-            interface_header_obj = Path(interface_header).resolve()
-            include_path = str(interface_header_obj).replace('\\', '/')  # Normalize path separators
+            # Use absolute path for the include (L1 already returns resolved paths)
+            include_path = interface_header.replace('\\', '/')  # Normalize path separators
             includes.append(f'#include "{include_path}"')
         else:
             # Fallback: use implementation header if interface header not found
-            file_path_obj = Path(file_path).resolve()
-            include_path = str(file_path_obj).replace('\\', '/')  # Use absolute path
+            include_path = file_path.replace('\\', '/')  # Already an absolute, resolved path
             includes.append(f'#include "{include_path}"')
     
     return includes
@@ -342,60 +439,62 @@ def add_includes_to_event_dispatcher(file_path: str, includes: List[str]) -> boo
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+            content = f.read()
         
         # Find line 6 (index 5) which has #include "01-IEventDispatcher.h"
         # We want to add includes after this line
         insert_index = 6  # After line 6 (0-indexed is line 6)
+        line_count = content.count('\n') + (1 if content and not content.endswith('\n') else 0)
         
-        if insert_index >= len(lines):
+        if insert_index >= line_count:
             # print(f"Error: Cannot find insertion point in {file_path}")
             return False
         
+        # Split after line 6 so the insertion point stays right after it once lines are removed
+        head_end = 0
+        for _ in range(insert_index):
+            head_end = content.index('\n', head_end) + 1
+        
         # Remove all existing controller includes (they will be replaced with correct ones)
         # Look for includes that point to controller files
-        import re
-        lines_to_remove = []
-        for i, line in enumerate(lines):
-            if line.strip().startswith('#include'):
-                # Check if this is a controller include (contains "controller" in path or matches pattern)
-                if 'controller' in line.lower() or re.search(r'/\d+-[A-Za-z0-9_]*Controller\.h', line):
-                    lines_to_remove.append(i)
-        
-        # Remove lines in reverse order to maintain indices
-        for i in reversed(lines_to_remove):
-            del lines[i]
-        
-        # Check if includes already exist (after removal)
-        existing_includes = set()
-        for i, line in enumerate(lines):
-            if line.strip().startswith('#include'):
-                existing_includes.add(line.strip())
+        head, removed_from_head = _CONTROLLER_INCLUDE_LINE_RE.subn('', content[:head_end])
+        tail, removed_from_tail = _CONTROLLER_INCLUDE_LINE_RE.subn('', content[head_end:])
+        
+        # Includes already present (after removal); new ones are added as they are accepted,
+        # so duplicates within includes are dropped in the same pass
+        seen_includes = set()
+        for part in (head, tail):
+            for match in _INCLUDE_LINE_RE.finditer(part):
+                seen_includes.add(match.group(0).strip())
         
         # Filter out includes that already exist
         new_includes = []
         for include in includes:
-            if include not in existing_includes:
+            include_key = include.strip()
+            if include_key not in seen_includes:
+                seen_includes.add(include_key)
                 new_includes.append(include + '\n')
         
-        if not new_includes and not lines_to_remove:
+        if not new_includes and not (removed_from_head or removed_from_tail):
             # print("ℹ️  All includes already exist in EventDispatcher.h")
             return True
         
-        # Find the insertion point (after line 6, but account for removed lines)
-        # Recalculate insert_index after removals
-        insert_index = 6
-        for removed_idx in lines_to_remove:
-            if removed_idx < insert_index:
-                insert_index -= 1
-        
         # Insert new includes after line 6
         if new_includes:
-            lines[insert_index:insert_index] = new_includes + ['\n']  # Add blank line after includes
-        
-        # Write back to file
+            head += ''.join(new_includes)
+            # Add blank line after includes, unless the one left behind by the removed
+            # includes is still there (otherwise every run would add another)
+            if not tail.startswith('\n'):
+                head += '\n'
+        
+        # Write back to file, unless the re-added includes reproduce it exactly
+        # (leaves the mtime alone so the build system does not rebuild)
+        new_content = head + tail
+        if new_content == content:
+            # print("ℹ️  All includes already exist in EventDispatcher.h")
+            return True
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+            f.write(new_content)
         
         # print(f"✅ Added {len(new_includes)} include(s) to EventDispatcher.h")
         return True
@@ -435,12 +534,19 @@ def update_initialize_mappings(file_path: str, code_content: str) -> bool:
         brace_count = 1  # We're already inside the opening brace
         pos = start_pos
         
-        while pos < len(content) and brace_count > 0:
-            if content[pos] == '{':
+        # Jump between braces with str.find instead of inspecting every character;
+        # each position is only searched again once it has been consumed
+        next_open = content.find('{', pos)
+        next_close = content.find('}', pos)
+        while brace_count > 0 and next_close != -1:
+            if next_open != -1 and next_open < next_close:
                 brace_count += 1
-            elif content[pos] == '}':
+                pos = next_open + 1
+                next_open = content.find('{', pos)
+            else:
                 brace_count -= 1
-            pos += 1
+                pos = next_close + 1
+                next_close = content.find('}', pos)
         
         if brace_count != 0:
             # print("⚠️  Warning: Could not find matching closing brace for InitializeMappings()")
@@ -450,11 +556,10 @@ def update_initialize_mappings(file_path: str, code_content: str) -> bool:
         function_header = match.group(0)
         function_footer = '}'
         
-        # Split code_content into lines and indent each line
-        if code_content.strip():
-            code_lines = code_content.strip().split('\n')
-            indented_lines = ['        ' + line if line.strip() else '' for line in code_lines]
-            indented_code = '\n'.join(indented_lines)
+        # Indent each line of code_content (whitespace-only lines become empty)
+        code_body = code_content.strip()
+        if code_body:
+            indented_code = _LINE_START_RE.sub('        ', _BLANK_LINE_RE.sub('', code_body))
             replacement = f"{function_header}\n{indented_code}\n    {function_footer}"
         else:
             replacement = f"{function_header}\n    {function_footer}"
@@ -463,8 +568,8 @@ def update_initialize_mappings(file_path: str, code_content: str) -> bool:
         new_content = content[:match.start()] + replacement + content[pos:]
         
         if new_content == content:
-            # print("⚠️  Warning: Could not find InitializeMappings() function to update")
-            return False
+            # print("ℹ️  InitializeMappings() is already up to date")
+            return True
         
         # Write back to file
         with open(file_path, 'w', encoding='utf-8') as f:
@@ -2,64 +2,270 @@
 """
 Script to check if C++ files contain the @Scope annotation with valid values above class declarations.
 Only accepts @Scope("PROTOTYPE") or @Scope("SINGLETON"). Ignores processed annotations.
+Found annotations are returned as ScopeMacro entries, which also support dict-style field access.
 """
 
+import os
 import re
+import mmap
 import argparse
-from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Set
+import bisect
+import functools
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Dict, Optional, Tuple, Set
 
 
-def find_scope_macros(file_path: str) -> List[Dict[str, str]]:
+# Single pattern for every @Scope form, dispatched on the named group that matched:
+# - annotation: /* @Scope("...") */ or /*@Scope("...")*/
+# - processed:  already processed /*--@Scope("...")--*/
+# - doc:        /// @Scope("...") doc-comment annotation
+# The legacy SCOPE(PROTOTYPE) / SCOPE(SINGLETON) macro is matched by _match_legacy_scope() instead
+_SCOPE_RE = re.compile(
+    r'(?P<processed>/\*--\s*@Scope\s*\(\s*["\'](?:PROTOTYPE|SINGLETON)["\']\s*\)\s*--\*/)'
+    r'|(?P<annotation>/\*\s*@Scope\s*\(\s*["\'](?P<annotation_value>PROTOTYPE|SINGLETON)["\']\s*\)\s*\*/)'
+    r'|(?P<doc>///\s*@Scope\s*\(\s*["\'](?:PROTOTYPE|SINGLETON)["\']\s*\))'
+)
+# Pattern to match class declarations
+_CLASS_RE = re.compile(r'class\s+([A-Za-z_][A-Za-z0-9_]*)\s*(?:[:{])')
+# Annotations allowed between @Scope and the class declaration
+_CONTINUATION_ANNOTATION_RE = re.compile(r'/\*\s*@(Component|Scope|Autowired)\s*\*/')
+_CONTINUATION_DOC_ANNOTATION_RE = re.compile(r'///\s*@(Component|Scope|Autowired)\b')
+# Every @Scope-related pattern needs "@Scope" or "SCOPE"; these locate the lines worth matching
+_SCOPE_MARKER_BYTES_RE = re.compile(rb'@Scope|SCOPE')
+_SCOPE_MARKER_LINE_RE = re.compile(r'^[^\n]*?(?:@Scope|SCOPE)[^\n]*', re.MULTILINE)
+# Byte-level forms for check_scope_macro_exists(), searched on the mapped file before any decoding
+_SCOPE_ANNOTATION_BYTES = b'@Scope'
+_LEGACY_SCOPE_BYTES_RE = re.compile(rb'SCOPE\s*\(\s*(?:PROTOTYPE|SINGLETON)\s*\)')
+# Below this many files, starting worker processes costs more than check_multiple_files() saves
+_PARALLEL_MIN_FILES = 32
+# Files up to this size are read into one shared buffer by check_multiple_files() and searched together
+_BATCH_MAX_FILE_SIZE = 64 * 1024
+# Suffixes accepted by validate_cpp_file()
+_CPP_EXTENSIONS = frozenset({'.cpp', '.h', '.hpp', '.cc', '.cxx', '.hh', '.hxx'})
+# A line including its newline, as file.readlines() returns it
+_LINE_RE = re.compile(r'[^\n]*\n|[^\n]+')
+
+
+@dataclass
+class ScopeMacro:
     """
-    Find all @Scope annotations in a C++ file and their context.
+    One @Scope annotation or legacy SCOPE macro found by find_scope_macros().
+    
+    Fields are also readable dict-style (macro_info['line_number'], macro_info.get('class_name')),
+    as find_scope_macros() returned plain dictionaries with these keys before.
+    """
+    __slots__ = ('macro', 'line_number', 'context', 'class_name', 'has_class', 'scope_value', 'is_valid')
+    
+    macro: str
+    line_number: int
+    context: List[str]
+    class_name: str
+    has_class: bool
+    scope_value: str
+    is_valid: bool
+    
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+    
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """
+    Return the index of the first non-whitespace character at or after pos.
     
     Args:
-        file_path: Path to the C++ file (.cpp, .h, or .hpp)
+        text: Text to scan
+        pos: Index to start at
         
     Returns:
-        List of dictionaries with 'macro', 'line_number', 'context', 'class_name', 'scope_value', and 'is_valid' keys
+        Index of the first non-whitespace character, or len(text) if there is none
     """
-    scope_macros = []
+    end = len(text)
+    while pos < end and text[pos].isspace():
+        pos += 1
+    return pos
+
+
+def _match_legacy_scope(text: str) -> Optional[Tuple[str, str]]:
+    """
+    Find the first legacy SCOPE(PROTOTYPE) / SCOPE(SINGLETON) macro with plain string operations.
+    Whitespace (including newlines) is allowed around the parentheses and the value.
     
+    Args:
+        text: Line or whole file content to search
+        
+    Returns:
+        Tuple of (macro text, scope value), or None if no legacy macro is found
+    """
+    start = text.find('SCOPE')
+    while start >= 0:
+        pos = _skip_whitespace(text, start + 5)
+        if text.startswith('(', pos):
+            pos = _skip_whitespace(text, pos + 1)
+            for scope_value in ('PROTOTYPE', 'SINGLETON'):
+                if text.startswith(scope_value, pos):
+                    end = _skip_whitespace(text, pos + len(scope_value))
+                    if text.startswith(')', end):
+                        return text[start:end + 1], scope_value
+                    break
+        start = text.find('SCOPE', start + 5)
+    return None
+
+
+def _scan_file(file_path: str) -> Optional[Dict[str, any]]:
+    """
+    Read a C++ file once and match every @Scope-related pattern on each line.
+    The result is shared by find_scope_macros() and check_scope_macro_exists(), and cached
+    per path, modification time and size. Only read-only callers may use it.
+    
+    Args:
+        file_path: Path to the C++ file
+        
+    Returns:
+        Dictionary with 'lines', 'stripped_lines', 'content' and 'scope_lines' keys, or None if the file cannot be read.
+        'scope_lines' holds (line index, stripped line, annotation match, processed match,
+        /// annotation match, legacy macro (text, value) tuple) for every line where any of them matched.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-    except FileNotFoundError:
+        stat_result = os.stat(file_path)
+    except OSError:
         # print(f"Error: File '{file_path}' not found")
-        return []
+        return None
+    return _scan_file_cached(file_path, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_file_cached(file_path: str, mtime_ns: int, size: int) -> Optional[Dict[str, any]]:
+    """
+    Cached body of _scan_file(); mtime_ns and size only serve as cache key.
+    
+    Args:
+        file_path: Path to the C++ file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Scan result as described in _scan_file(), or None if the file cannot be read
+    """
+    return _read_and_scan_file(file_path)
+
+
+def _read_and_scan_file(file_path: str) -> Optional[Dict[str, any]]:
+    """
+    Uncached body of _scan_file(). Writers call it directly, so they always work on the
+    current file content: an edit that keeps the size within the filesystem's timestamp
+    granularity would otherwise be served from the cache and overwritten.
+    
+    Args:
+        file_path: Path to the C++ file
+        
+    Returns:
+        Scan result as described in _scan_file(), or None if the file cannot be read
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                data = b''
+            else:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Most files hold no @Scope/SCOPE at all: decide that in C without decoding
+                    if not _SCOPE_MARKER_BYTES_RE.search(mm):
+                        return {'lines': (), 'stripped_lines': (), 'content': '', 'scope_lines': ()}
+                    data = mm[:]
+        # Decode and translate newlines the way text-mode reading does
+        content = data.decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
     except Exception as e:
         # print(f"Error reading file '{file_path}': {e}")
-        return []
+        return None
+    
+    scope_lines = []
+    # Matches come in file order, so line numbers are kept as a running newline count
+    index = 0
+    counted_up_to = 0
+    for line_match in _SCOPE_MARKER_LINE_RE.finditer(content):
+        index += content.count('\n', counted_up_to, line_match.start())
+        counted_up_to = line_match.start()
+        stripped_line = line_match.group(0).strip()
+        # The three forms cannot overlap, so one finditer sees the first occurrence of each
+        found = {}
+        for scope_match in _SCOPE_RE.finditer(stripped_line):
+            found.setdefault(scope_match.lastgroup, scope_match)
+        legacy_scope = _match_legacy_scope(stripped_line) if 'SCOPE' in stripped_line else None
+        if found or legacy_scope:
+            scope_lines.append((index, stripped_line, found.get('annotation'), found.get('processed'),
+                                found.get('doc'), legacy_scope))
     
-    # Pattern to match @Scope annotation with parameter (search for /* @Scope("...") */ or /*@Scope("...")*/)
-    # Also check for already processed /*--@Scope("...")--*/ pattern
-    scope_annotation_pattern = re.compile(r'/\*\s*@Scope\s*\(\s*["\'](PROTOTYPE|SINGLETON)["\']\s*\)\s*\*/')
-    scope_processed_pattern = re.compile(r'/\*--\s*@Scope\s*\(\s*["\'](PROTOTYPE|SINGLETON)["\']\s*\)\s*--\*/')
+    lines = tuple(_LINE_RE.findall(content))
+    return {
+        'lines': lines,
+        # Stripped once here instead of on every class look-ahead
+        'stripped_lines': tuple(line.strip() for line in lines),
+        'content': content,
+        'scope_lines': tuple(scope_lines)
+    }
+
+
+def find_scope_macros(file_path: str) -> List[ScopeMacro]:
+    """
+    Find all @Scope annotations in a C++ file and their context.
+    
+    Args:
+        file_path: Path to the C++ file (.cpp, .h, or .hpp)
+        
+    Returns:
+        List of ScopeMacro entries, in file order
+    """
+    return list(iter_scope_macros(file_path))
+
+
+def iter_scope_macros(file_path: str) -> Iterator[ScopeMacro]:
+    """
+    Yield the @Scope annotations of a C++ file one at a time, as find_scope_macros() lists them.
     
-    # Pattern to match class declarations
-    class_pattern = r'class\s+([A-Za-z_][A-Za-z0-9_]*)\s*(?:[:{])'
+    Args:
+        file_path: Path to the C++ file (.cpp, .h, or .hpp)
+        
+    Returns:
+        Iterator over ScopeMacro entries, in file order
+    """
+    scan = _scan_file(file_path)
+    if scan is None:
+        return
+    stripped_lines = scan['stripped_lines']
     
-    for line_num, line in enumerate(lines, 1):
-        stripped_line = line.strip()
+    # Lines without any @Scope/SCOPE match cannot contribute, so only the scanned lines are visited
+    for index, stripped_line, scope_match, processed_match, _, legacy_scope_match in scan['scope_lines']:
+        line_num = index + 1
         
         # Skip already processed annotations
-        if scope_processed_pattern.search(stripped_line):
+        if processed_match:
             continue
         
         # Skip other comments that aren't @Scope annotations
         # But allow /* @Scope("...") */ annotations to be processed
-        if stripped_line.startswith('/*') and not scope_annotation_pattern.search(stripped_line):
+        if stripped_line.startswith('/*') and not scope_match:
             continue
         # Skip single-line comments
         if stripped_line.startswith('//'):
             continue
             
         # Check if line contains valid @Scope annotation
-        scope_match = scope_annotation_pattern.search(stripped_line)
         if scope_match:
-            annotation_text = scope_match.group(0)
-            scope_value = scope_match.group(1)
+            annotation_text = scope_match.group('annotation')
+            scope_value = scope_match.group('annotation_value')
             
             # Look ahead for class declaration (within next few lines)
             # Allow other annotations/macros to appear between @Scope and class
@@ -67,82 +273,73 @@ def find_scope_macros(file_path: str) -> List[Dict[str, str]]:
             class_name = ""
             context_lines = []
             
-            # Check next 5 lines for class declaration
-            for i in range(line_num, min(line_num + 6, len(lines) + 1)):
-                if i <= len(lines):
-                    next_line = lines[i - 1].strip()
-                    context_lines.append(next_line)
-                    
-                    # Skip other comments that aren't annotations
-                    # But allow /* @Component */, /* @Scope */, /* @Autowired */ annotations to be processed
-                    if next_line.startswith('/*') and not re.search(r'/\*\s*@(Component|Scope|Autowired)\s*\*/', next_line):
-                        continue
-                    # Skip single-line comments
-                    if next_line.startswith('//'):
-                        continue
-                    
-                    # Check for class declaration
-                    class_match = re.search(class_pattern, next_line)
-                    if class_match:
-                        class_found = True
-                        class_name = class_match.group(1)
-                        break
-                    
-                    # Stop if we hit a blank line or something that's not an annotation/macro
-                    if not next_line:
-                        continue
-                    # Allow annotations and common macros to continue searching
-                    is_annotation_or_macro = (
-                        re.search(r'///\s*@(Component|Scope|Autowired)\b', next_line) or
-                        next_line.startswith(('COMPONENT', 'SCOPE', 'VALIDATE', 'AUTOWIRED'))
-                    )
-                    if not is_annotation_or_macro:
-                        break
+            # Check this line and the next 5 lines for class declaration
+            for next_line in stripped_lines[index:index + 6]:
+                context_lines.append(next_line)
+                
+                # Skip other comments that aren't annotations
+                # But allow /* @Component */, /* @Scope */, /* @Autowired */ annotations to be processed
+                if next_line.startswith('/*') and not _CONTINUATION_ANNOTATION_RE.search(next_line):
+                    continue
+                # Skip single-line comments
+                if next_line.startswith('//'):
+                    continue
+                
+                # Check for class declaration (the substring test spares the regex on most lines)
+                class_match = _CLASS_RE.search(next_line) if 'class' in next_line else None
+                if class_match:
+                    class_found = True
+                    class_name = class_match.group(1)
+                    break
+                
+                # Stop if we hit a blank line or something that's not an annotation/macro
+                if not next_line:
+                    continue
+                # Allow annotations and common macros to continue searching
+                is_annotation_or_macro = (
+                    _CONTINUATION_DOC_ANNOTATION_RE.search(next_line) or
+                    next_line.startswith(('COMPONENT', 'SCOPE', 'VALIDATE', 'AUTOWIRED'))
+                )
+                if not is_annotation_or_macro:
+                    break
             
-            scope_macros.append({
-                'macro': annotation_text,
-                'line_number': line_num,
-                'context': context_lines,
-                'class_name': class_name,
-                'has_class': class_found,
-                'scope_value': scope_value,
-                'is_valid': scope_value in ['PROTOTYPE', 'SINGLETON']
-            })
+            yield ScopeMacro(
+                macro=annotation_text,
+                line_number=line_num,
+                context=context_lines,
+                class_name=class_name,
+                has_class=class_found,
+                scope_value=scope_value,
+                is_valid=scope_value in ['PROTOTYPE', 'SINGLETON']
+            )
         
         # Check for legacy SCOPE macro (for backward compatibility)
-        legacy_scope_pattern = r'SCOPE\s*\(\s*(PROTOTYPE|SINGLETON)\s*\)'
-        legacy_scope_match = re.search(legacy_scope_pattern, stripped_line)
         if legacy_scope_match and not stripped_line.startswith('//') and not stripped_line.startswith('/*'):
-            macro_text = legacy_scope_match.group(0)
-            scope_value = legacy_scope_match.group(1)
+            macro_text, scope_value = legacy_scope_match
             
             # Look ahead for class declaration
             class_found = False
             class_name = ""
-            for i in range(line_num, min(line_num + 6, len(lines) + 1)):
-                if i <= len(lines):
-                    next_line = lines[i - 1].strip()
-                    if next_line.startswith('//') or next_line.startswith('/*'):
-                        continue
-                    class_match = re.search(class_pattern, next_line)
-                    if class_match:
-                        class_found = True
-                        class_name = class_match.group(1)
-                        break
-                    if not next_line or (next_line and not next_line.startswith(('COMPONENT', 'SCOPE', 'VALIDATE'))):
-                        break
+            for next_line in stripped_lines[index:index + 6]:
+                if next_line.startswith('//') or next_line.startswith('/*'):
+                    continue
+                class_match = _CLASS_RE.search(next_line) if 'class' in next_line else None
+                if class_match:
+                    class_found = True
+                    class_name = class_match.group(1)
+                    break
+                if not next_line or (next_line and not next_line.startswith(('COMPONENT', 'SCOPE', 'VALIDATE'))):
+                    break
             
-            scope_macros.append({
-                'macro': macro_text,
-                'line_number': line_num,
-                'context': [],
-                'class_name': class_name,
-                'has_class': class_found,
-                'scope_value': scope_value,
-                'is_valid': scope_value in ['PROTOTYPE', 'SINGLETON']
-            })
-    
-    return scope_macros
+            yield ScopeMacro(
+                macro=macro_text,
+                line_number=line_num,
+                context=[],
+                class_name=class_name,
+                has_class=class_found,
+                scope_value=scope_value,
+                is_valid=scope_value in ['PROTOTYPE', 'SINGLETON']
+            )
 
 
 def check_scope_macro_exists(file_path: str) -> bool:
@@ -156,43 +353,48 @@ def check_scope_macro_exists(file_path: str) -> bool:
     Returns:
         True if @Scope annotation or SCOPE macro is found, False otherwise
     """
+    # Boolean probe: most files have neither form, which the raw bytes prove without a full scan
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-        
-        scope_annotation_pattern = re.compile(r'///\s*@Scope\s*\(\s*["\'](PROTOTYPE|SINGLETON)["\']\s*\)')
-        scope_processed_pattern = re.compile(r'/\*\s*@Scope\s*\(\s*["\'](PROTOTYPE|SINGLETON)["\']\s*\)\s*\*/')
-        
-        # Check each line for @Scope annotation
-        for line in lines:
-            stripped_line = line.strip()
-            
-            # Skip already processed annotations
-            if scope_processed_pattern.search(stripped_line):
-                continue
-            
-            # Skip comments (but not annotations)
-            if stripped_line.startswith('/*'):
-                continue
-            if stripped_line.startswith('//') and not scope_annotation_pattern.search(stripped_line):
-                continue
-                
-            # Check if line contains @Scope annotation
-            if scope_annotation_pattern.search(stripped_line):
-                return True
-        
-        # Also check for legacy SCOPE macro (for backward compatibility)
-        # Check for SCOPE(PROTOTYPE) or SCOPE(SINGLETON) patterns
-        content = ''.join(lines)
-        legacy_pattern = re.compile(r'SCOPE\s*\(\s*(PROTOTYPE|SINGLETON)\s*\)')
-        return bool(legacy_pattern.search(content))
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(_SCOPE_ANNOTATION_BYTES) < 0 and not _LEGACY_SCOPE_BYTES_RE.search(mm):
+                    return False
     except Exception:
         return False
+    
+    scan = _scan_file(file_path)
+    if scan is None:
+        return False
+    
+    # Check each scanned line for @Scope annotation
+    for _, stripped_line, scope_match, _, doc_annotation_match, _ in scan['scope_lines']:
+        # Skip /* @Scope("...") */ annotations (the /// form is what counts here)
+        if scope_match:
+            continue
+        
+        # Skip comments (but not annotations)
+        if stripped_line.startswith('/*'):
+            continue
+        if stripped_line.startswith('//') and not doc_annotation_match:
+            continue
+            
+        # Check if line contains @Scope annotation
+        if doc_annotation_match:
+            return True
+    
+    # Also check for legacy SCOPE macro (for backward compatibility)
+    # Check for SCOPE(PROTOTYPE) or SCOPE(SINGLETON) patterns (may span lines, so search the whole content)
+    return _match_legacy_scope(scan['content']) is not None
 
 
 def validate_scope_macro_placement(file_path: str) -> Dict[str, any]:
     """
     Comprehensive validation of @Scope annotation placement and usage.
+    Results are cached per file path, modification time and size; see clear_cache().
+    The returned dictionary and its lists are copies, but the ScopeMacro entries
+    are shared with the cache and must be treated as read-only.
     
     Args:
         file_path: Path to the C++ file
@@ -200,40 +402,78 @@ def validate_scope_macro_placement(file_path: str) -> Dict[str, any]:
     Returns:
         Dictionary with validation results
     """
-    scope_macros = find_scope_macros(file_path)
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return _validate_scope_macro_placement(file_path)
     
-    if not scope_macros:
-        return {
-            'file_path': file_path,
-            'has_scope': False,
-            'scope_count': 0,
-            'valid_placements': 0,
-            'invalid_placements': 0,
-            'valid_values': 0,
-            'invalid_values': 0,
-            'issues': ['No @Scope annotation found']
-        }
+    # Fresh dict and lists, so callers can add keys or items without altering the cached entry
+    cached = _validate_cached(file_path, stat_result.st_mtime_ns, stat_result.st_size)
+    return {key: list(value) if isinstance(value, list) else value for key, value in cached.items()}
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, any]:
+    """
+    Cached body of validate_scope_macro_placement(); mtime_ns and size only serve as cache key.
     
+    Args:
+        file_path: Path to the C++ file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Dictionary with validation results
+    """
+    return _validate_scope_macro_placement(file_path)
+
+
+def clear_cache() -> None:
+    """
+    Drop all cached scan and validation results.
+    Only needed by callers that rewrite files within the same modification time and size.
+    """
+    _scan_file_cached.cache_clear()
+    _validate_cached.cache_clear()
+
+
+def _validate_scope_macro_placement(file_path: str) -> Dict[str, any]:
+    """
+    Uncached body of validate_scope_macro_placement().
+    
+    Args:
+        file_path: Path to the C++ file
+        
+    Returns:
+        Dictionary with validation results
+    """
+    scope_macros = []
     valid_placements = 0
     invalid_placements = 0
     valid_values = 0
     invalid_values = 0
     issues = []
     
-    for macro_info in scope_macros:
+    # Collect and count in the same pass over the scan
+    for macro_info in iter_scope_macros(file_path):
+        scope_macros.append(macro_info)
+        
         # Check placement (must be above class)
-        if macro_info['has_class']:
+        if macro_info.has_class:
             valid_placements += 1
         else:
             invalid_placements += 1
-            issues.append(f"@Scope annotation at line {macro_info['line_number']} not followed by class declaration")
+            issues.append(f"@Scope annotation at line {macro_info.line_number} not followed by class declaration")
         
         # Check scope value (must be PROTOTYPE or SINGLETON)
-        if macro_info['is_valid']:
+        if macro_info.is_valid:
             valid_values += 1
         else:
             invalid_values += 1
-            issues.append(f"@Scope annotation at line {macro_info['line_number']} has invalid value: {macro_info['scope_value']}")
+            issues.append(f"@Scope annotation at line {macro_info.line_number} has invalid value: {macro_info.scope_value}")
+    
+    if not scope_macros:
+        return _no_scope_result(file_path)
     
     return {
         'file_path': file_path,
@@ -248,6 +488,77 @@ def validate_scope_macro_placement(file_path: str) -> Dict[str, any]:
     }
 
 
+def _no_scope_result(file_path: str) -> Dict[str, any]:
+    """
+    Validation result for a file without any @Scope annotation.
+    
+    Args:
+        file_path: Path to the C++ file
+        
+    Returns:
+        Dictionary with validation results
+    """
+    return {
+        'file_path': file_path,
+        'has_scope': False,
+        'scope_count': 0,
+        'valid_placements': 0,
+        'invalid_placements': 0,
+        'valid_values': 0,
+        'invalid_values': 0,
+        'issues': ['No @Scope annotation found']
+    }
+
+
+def _files_with_scope_marker(file_paths: List[str]) -> Set[str]:
+    """
+    Find the files that may contain an @Scope annotation or SCOPE macro.
+    Small files are joined into one buffer and searched in a single pass; each
+    match is attributed to its file by offset, and the search resumes at the next file.
+    
+    Args:
+        file_paths: List of file paths to check
+        
+    Returns:
+        Set of paths that contain "@Scope" or "SCOPE", plus every path that was too large
+        or could not be read here (those are left to the per-file validation)
+    """
+    candidates = set()
+    batched_paths = []
+    contents = []
+    for file_path in file_paths:
+        try:
+            if os.stat(file_path).st_size > _BATCH_MAX_FILE_SIZE:
+                candidates.add(file_path)
+                continue
+            with open(file_path, 'rb') as file:
+                contents.append(file.read())
+        except OSError:
+            candidates.add(file_path)
+            continue
+        batched_paths.append(file_path)
+    
+    # A NUL separator cannot be part of a marker, so no match spans two files
+    buffer = b'\0'.join(contents)
+    # next_starts[i] is the offset where the file after batched_paths[i] begins
+    next_starts = []
+    offset = 0
+    for content in contents:
+        offset += len(content) + 1
+        next_starts.append(offset)
+    
+    position = 0
+    while True:
+        marker_match = _SCOPE_MARKER_BYTES_RE.search(buffer, position)
+        if marker_match is None:
+            break
+        file_index = bisect.bisect_right(next_starts, marker_match.start())
+        candidates.add(batched_paths[file_index])
+        position = next_starts[file_index]
+    
+    return candidates
+
+
 def check_multiple_files(file_paths: List[str]) -> Dict[str, Dict[str, any]]:
     """
     Check SCOPE macro in multiple files.
@@ -258,10 +569,23 @@ def check_multiple_files(file_paths: List[str]) -> Dict[str, Dict[str, any]]:
     Returns:
         Dictionary mapping file paths to validation results
     """
+    # Only files that may hold @Scope need the full validation
+    candidates = _files_with_scope_marker(file_paths)
+    candidate_paths = [file_path for file_path in file_paths if file_path in candidates]
+    
+    if len(candidate_paths) > _PARALLEL_MIN_FILES:
+        # Files are independent: validate them in parallel across CPU cores
+        chunksize = max(1, len(candidate_paths) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor() as executor:
+            validated = dict(zip(candidate_paths, executor.map(validate_scope_macro_placement, candidate_paths, chunksize=chunksize)))
+    else:
+        validated = {file_path: validate_scope_macro_placement(file_path) for file_path in candidate_paths}
+    
     results = {}
     
+    # Keep the input order
     for file_path in file_paths:
-        results[file_path] = validate_scope_macro_placement(file_path)
+        results[file_path] = validated[file_path] if file_path in validated else _no_scope_result(file_path)
     
     return results
 
@@ -276,12 +600,21 @@ def validate_cpp_file(file_path: str) -> bool:
     Returns:
         True if it's a C++ file, False otherwise
     """
-    cpp_extensions = {'.cpp', '.h', '.hpp', '.cc', '.cxx', '.hh', '.hxx'}
-    return Path(file_path).suffix.lower() in cpp_extensions
+    # splitext works on the string directly, without building a Path
+    return os.path.splitext(file_path)[1].lower() in _CPP_EXTENSIONS
 
 
-def main():
-    """Main function to handle command line arguments and execute the validation."""
+def main(results_needed: bool = True):
+    """
+    Main function to handle command line arguments and execute the validation.
+    
+    Args:
+        results_needed: False if the caller discards the returned results (as the script
+            run does); the files are then only checked when --output writes them out
+    
+    Returns:
+        Dictionary mapping file paths to their results, or {} if nothing was checked
+    """
     parser = argparse.ArgumentParser(
         description="Check if C++ files contain @Scope annotation with valid values (PROTOTYPE/SINGLETON) above class declarations"
     )
@@ -312,9 +645,11 @@ def main():
     
     args = parser.parse_args()
     
-    # Filter valid C++ files
-    valid_files = [f for f in args.files if validate_cpp_file(f)]
-    invalid_files = [f for f in args.files if not validate_cpp_file(f)]
+    # Filter valid C++ files, checking each file once
+    valid_files = []
+    invalid_files = []
+    for f in args.files:
+        (valid_files if validate_cpp_file(f) else invalid_files).append(f)
     
     if invalid_files:
         # print(f"Warning: Skipping non-C++ files: {', '.join(invalid_files)}")
@@ -324,6 +659,10 @@ def main():
         # print("No valid C++ files provided")
         return {}
     
+    # All printing is disabled, so without --output only the return value consumes the results
+    if not results_needed and not args.output:
+        return {}
+    
     # Check files
     if args.simple:
         # Simple check mode
@@ -354,10 +693,10 @@ def main():
         #         if args.detailed and result['macros']:
         #             print(f"\n  Detailed annotation information:")
         #             for macro in result['macros']:
-        #                 print(f"    Line {macro['line_number']}: {macro['macro']}")
-        #                 print(f"      Scope value: {macro['scope_value']}")
-        #                 if macro['has_class']:
-        #                     print(f"      → Class: {macro['class_name']}")
+        #                 print(f"    Line {macro.line_number}: {macro.macro}")
+        #                 print(f"      Scope value: {macro.scope_value}")
+        #                 if macro.has_class:
+        #                     print(f"      → Class: {macro.class_name}")
         #                 else:
         #                     print(f"      → No class found")
         #         
@@ -430,50 +769,46 @@ def mark_scope_annotation_processed(file_path: str) -> bool:
         True if file was modified successfully, False otherwise
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
+        # Freshly read, never from the cache: the lines below are written back to the file
+        scan = _read_and_scan_file(file_path)
+        if scan is None:
+            # print(f"Error: File '{file_path}' could not be read")
+            return False
         
-        scope_annotation_pattern = re.compile(r'/\*\s*@Scope\s*\(\s*["\'](PROTOTYPE|SINGLETON)["\']\s*\)\s*\*/')
-        scope_processed_pattern = re.compile(r'/\*--\s*@Scope\s*\(\s*["\'](PROTOTYPE|SINGLETON)["\']\s*\)\s*--\*/')
+        lines = scan['lines']
+        # (line index, new line) in file order; the line tuple itself is never copied
+        replacements = []
         
-        modified = False
-        modified_lines = []
-        
-        for i, line in enumerate(lines):
-            stripped_line = line.strip()
+        for i, stripped_line, scope_match, processed_match, _, legacy_match in scan['scope_lines']:
+            line = lines[i]
             
             # Skip already processed annotations
-            if scope_processed_pattern.search(stripped_line):
-                modified_lines.append(line)
+            if processed_match:
                 continue
             
             # Check if line contains @Scope annotation
-            scope_match = scope_annotation_pattern.search(stripped_line)
             if scope_match:
                 indent = len(line) - len(line.lstrip())
                 indent_str = line[:indent]
                 # Preserve the full annotation with parameter
-                full_annotation = scope_match.group(0)
-                scope_value = scope_match.group(1)
-                processed_line = f"{indent_str}/*--@Scope(\"{scope_value}\")--*/\n"
-                modified_lines.append(processed_line)
-                modified = True
+                scope_value = scope_match.group('annotation_value')
+                replacements.append((i, f"{indent_str}/*--@Scope(\"{scope_value}\")--*/\n"))
                 continue
             
             # Check for legacy SCOPE macro (for backward compatibility)
-            legacy_scope_pattern = re.compile(r'SCOPE\s*\(\s*(PROTOTYPE|SINGLETON)\s*\)')
-            legacy_match = legacy_scope_pattern.search(stripped_line)
             if legacy_match and not stripped_line.startswith('//') and not stripped_line.startswith('/*'):
-                modified_lines.append('// ' + line)
-                modified = True
-                continue
-            
-            modified_lines.append(line)
+                replacements.append((i, '// ' + line))
         
         # Write back to file if modifications were made
-        if modified:
+        if replacements:
             with open(file_path, 'w', encoding='utf-8') as file:
-                file.writelines(modified_lines)
+                # Unchanged runs of lines are written as slices between the replaced lines
+                previous_end = 0
+                for i, new_line in replacements:
+                    file.writelines(lines[previous_end:i])
+                    file.write(new_line)
+                    previous_end = i + 1
+                file.writelines(lines[previous_end:])
             # print(f"✓ Processed @Scope annotation in: {file_path}")
         else:
             # print(f"ℹ No @Scope annotation found to process in: {file_path}")
@@ -481,9 +816,6 @@ def mark_scope_annotation_processed(file_path: str) -> bool:
         
         return True
         
-    except FileNotFoundError:
-        # print(f"Error: File '{file_path}' not found")
-        return False
     except Exception as e:
         # print(f"Error modifying file '{file_path}': {e}")
         return False
@@ -491,15 +823,19 @@ def mark_scope_annotation_processed(file_path: str) -> bool:
 
 # Export functions for other scripts to import
 __all__ = [
+    'ScopeMacro',
     'find_scope_macros',
+    'iter_scope_macros',
     'check_scope_macro_exists',
     'validate_scope_macro_placement',
     'check_multiple_files',
     'mark_scope_annotation_processed',
+    'clear_cache',
     'main'
 ]
 
 
 if __name__ == "__main__":
-    # When run as script, execute main and store result
-    result = main()
+    # When run as script, execute main and store result; nothing reads it, so the
+    # files are only checked if --output needs them
+    result = main(results_needed=False)
@@ -20,8 +20,6 @@ def find_class_names(file_path: str) -> List[str]:
     Returns:
         List of class names found in the file
     """
-    class_names = []
-    
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
             content = file.read()
@@ -32,6 +30,21 @@ def find_class_names(file_path: str) -> List[str]:
         # print(f"Error reading file '{file_path}': {e}")
         return []
     
+    return find_class_names_from_text(content)
+
+
+def find_class_names_from_text(content: str) -> List[str]:
+    """
+    Find all class names in already-read C++ source text.
+    
+    Args:
+        content: C++ source code
+        
+    Returns:
+        List of class names found in the text
+    """
+    class_names = []
+    
     # Enhanced pattern to match class declarations including final, template, etc.
     # Matches various class declaration patterns:
     # - class ClassName
@@ -191,6 +204,7 @@ def get_class_names_from_files(file_paths: List[str]) -> dict:
 # Export functions for other scripts to import
 __all__ = [
     'find_class_names', 
+    'find_class_names_from_text',
     'find_class_names_in_files', 
     'main', 
     'get_class_names_from_file',
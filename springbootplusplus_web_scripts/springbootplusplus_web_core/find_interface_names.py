@@ -20,8 +20,6 @@ def find_interface_names(file_path: str) -> List[str]:
     Returns:
         List of interface names found in the file
     """
-    interface_names = []
-    
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
             content = file.read()
@@ -32,6 +30,21 @@ def find_interface_names(file_path: str) -> List[str]:
         print(f"Error reading file '{file_path}': {e}")
         return []
     
+    return find_interface_names_from_text(content)
+
+
+def find_interface_names_from_text(content: str) -> List[str]:
+    """
+    Find all interface names from class inheritance declarations in already-read C++ source text.
+    
+    Args:
+        content: C++ source code
+        
+    Returns:
+        List of interface names found in the text
+    """
+    interface_names = []
+    
     # Pattern to match class inheritance declarations
     # Matches various inheritance patterns:
     # - class ClassName : public InterfaceName
@@ -277,6 +290,7 @@ def get_inheritance_details_from_file(file_path: str) -> List[Dict[str, str]]:
 # Export functions for other scripts to import
 __all__ = [
     'find_interface_names', 
+    'find_interface_names_from_text',
     'find_interface_names_in_files',
     'find_class_inheritance_details',
     'main', 
@@ -8,6 +8,11 @@ import os
 import sys
 import argparse
 from pathlib import Path
+from typing import List
+
+# __file__ does not change while the process runs, so it is resolved once at import
+_CURRENT_FILE_PATH = os.path.realpath(__file__)
+_CURRENT_DIRECTORY_PATH = os.path.dirname(_CURRENT_FILE_PATH)
 
 
 def get_file_path(file_path: str) -> str:
@@ -20,41 +25,53 @@ def get_file_path(file_path: str) -> str:
     Returns:
         Absolute path of the file
     """
-    # Convert to absolute path and resolve any symlinks
-    absolute_path = os.path.abspath(file_path)
-    resolved_path = os.path.realpath(absolute_path)
+    # realpath already makes the path absolute while resolving any symlinks
+    return os.path.realpath(file_path)
+
+
+def resolve_many(file_paths: List[str]) -> List[str]:
+    """
+    Get the full absolute paths of several files, resolving each path once.
     
-    return resolved_path
+    Args:
+        file_paths: Paths to the files (can be relative or absolute)
+        
+    Returns:
+        List of absolute paths, in the same order as the input
+    """
+    return [os.path.realpath(file_path) for file_path in file_paths]
 
 
-def get_directory_path(file_path: str) -> str:
+def get_directory_path(file_path: str, resolved: bool = False) -> str:
     """
     Get the full absolute path of the directory containing the given file.
     
     Args:
         file_path: Path to the file
+        resolved: True if file_path was already returned by get_file_path()
         
     Returns:
         Absolute path of the directory containing the file
     """
-    file_abs_path = get_file_path(file_path)
+    file_abs_path = file_path if resolved else get_file_path(file_path)
     directory_path = os.path.dirname(file_abs_path)
     
     return directory_path
 
 
-def get_relative_path_from_root(file_path: str, root_dir: str = ".") -> str:
+def get_relative_path_from_root(file_path: str, root_dir: str = ".", resolved: bool = False) -> str:
     """
     Get the relative path of a file from a specified root directory.
     
     Args:
         file_path: Path to the file
         root_dir: Root directory to calculate relative path from (default: current working directory)
+        resolved: True if file_path was already returned by get_file_path()
         
     Returns:
         Relative path from root directory to the file
     """
-    file_abs_path = get_file_path(file_path)
+    file_abs_path = file_path if resolved else get_file_path(file_path)
     root_path = os.path.abspath(root_dir)
     
     try:
@@ -72,14 +89,7 @@ def get_current_file_path() -> str:
     Returns:
         Absolute path of the current file
     """
-    # Get the path of the current file
-    current_file = __file__
-    
-    # Convert to absolute path and resolve any symlinks
-    absolute_path = os.path.abspath(current_file)
-    resolved_path = os.path.realpath(absolute_path)
-    
-    return resolved_path
+    return _CURRENT_FILE_PATH
 
 
 def get_current_directory_path() -> str:
@@ -89,10 +99,7 @@ def get_current_directory_path() -> str:
     Returns:
         Absolute path of the current directory
     """
-    current_file_path = get_current_file_path()
-    directory_path = os.path.dirname(current_file_path)
-    
-    return directory_path
+    return _CURRENT_DIRECTORY_PATH
 
 
 def main():
@@ -116,20 +123,20 @@ def main():
     # Process each input file
     file_paths = []
     
-    for file_path in args.files:
+    for file_path, resolved_path in zip(args.files, resolve_many(args.files)):
         # print(f"\nFile: {file_path}")
-        # print(f"  Absolute path: {get_file_path(file_path)}")
-        # print(f"  Directory: {get_directory_path(file_path)}")
+        # print(f"  Absolute path: {resolved_path}")
+        # print(f"  Directory: {get_directory_path(resolved_path, resolved=True)}")
         
         # Show relative path from specified root
         try:
-            relative_path = get_relative_path_from_root(file_path, args.root)
+            relative_path = get_relative_path_from_root(resolved_path, args.root, resolved=True)
             # print(f"  Relative path from {args.root}: {relative_path}")
         except Exception as e:
             # print(f"  Could not calculate relative path: {e}")
             pass
         
-        file_paths.append(get_file_path(file_path))
+        file_paths.append(resolved_path)
     
     # If only one file, return its path; otherwise return list of paths
     if len(file_paths) == 1:
@@ -141,6 +148,7 @@ def main():
 # Export functions for other scripts to import
 __all__ = [
     'get_file_path',
+    'resolve_many',
     'get_directory_path',
     'get_relative_path_from_root',
     'get_current_file_path',
@@ -26,6 +26,11 @@ if match:
     print(f"\nArgs string: '{args_str}'")
     
     # Test splitting manually
+    # Jump between the characters that matter instead of stepping through every character.
+    # Outside an annotation /* opens one and , can split; inside, only */ ends it (and , is kept).
+    token_outside_annotation = re.compile(r'/\*|[<>(),]')
+    token_inside_annotation = re.compile(r'\*/|[<>()]')
+    
     current_param = ""
     angle_bracket_depth = 0
     paren_depth = 0
@@ -34,45 +39,52 @@ if match:
     i = 0
     params = []
     while i < len(args_str):
-        char = args_str[i]
+        token_pattern = token_inside_annotation if in_annotation else token_outside_annotation
+        token_match = token_pattern.search(args_str, i)
+        if not token_match:
+            current_param += args_str[i:]
+            i = len(args_str)
+            break
+        
+        # Copy everything up to the token in one go
+        current_param += args_str[i:token_match.start()]
+        token = token_match.group(0)
+        i = token_match.start()
         
         # Check for annotation boundaries
-        if i < len(args_str) - 1:
-            two_chars = args_str[i:i+2]
-            
-            if two_chars == '/*' and not in_annotation:
-                in_annotation = True
-                current_param += two_chars
-                i += 2
-                print(f"  [i={i}] Found /*, in_annotation=True, current_param='{current_param}'")
-                continue
-            elif two_chars == '*/' and in_annotation:
-                in_annotation = False
-                current_param += two_chars
-                i += 2
-                print(f"  [i={i}] Found */, in_annotation=False, current_param='{current_param}'")
-                continue
+        if token == '/*':
+            in_annotation = True
+            current_param += token
+            i += 2
+            print(f"  [i={i}] Found /*, in_annotation=True, current_param='{current_param}'")
+            continue
+        elif token == '*/':
+            in_annotation = False
+            current_param += token
+            i += 2
+            print(f"  [i={i}] Found */, in_annotation=False, current_param='{current_param}'")
+            continue
         
-        if char == '<':
+        if token == '<':
             angle_bracket_depth += 1
-            current_param += char
-        elif char == '>':
+            current_param += token
+        elif token == '>':
             angle_bracket_depth -= 1
-            current_param += char
-        elif char == '(':
+            current_param += token
+        elif token == '(':
             paren_depth += 1
-            current_param += char
-        elif char == ')':
+            current_param += token
+        elif token == ')':
             paren_depth -= 1
-            current_param += char
-        elif char == ',' and angle_bracket_depth == 0 and paren_depth == 0 and not in_annotation:
+            current_param += token
+        elif token == ',' and angle_bracket_depth == 0 and paren_depth == 0:
             param_str = current_param.strip()
             print(f"  [i={i}] Found comma separator, param='{param_str}'")
             if param_str:
                 params.append(param_str)
             current_param = ""
         else:
-            current_param += char
+            current_param += token
         
         i += 1
     